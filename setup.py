@@ -22,6 +22,7 @@ api_requires = read_requirements("api.txt")
 dev_requires = read_requirements("development.txt")
 prod_requires = read_requirements("production.txt")
 test_requires = read_requirements("testing.txt")
+fast_requires = read_requirements("fast.txt")
 
 # Remove base requirements from other requires to avoid duplication
 api_requires = [req for req in api_requires if req not in install_requires]
@@ -39,12 +40,16 @@ test_requires = [
     req for req in test_requires if req not in install_requires and req not in api_requires
 ]
 
+# Optional accelerators for JSON/xlsx exports and seed matching
+fast_requires = [req for req in fast_requires if req not in install_requires]
+
 extras_require = {
     "dev": dev_requires,
     "api": api_requires,
     "prod": prod_requires,
     "test": test_requires,
-    "all": api_requires + dev_requires + prod_requires + test_requires,
+    "fast": fast_requires,
+    "all": api_requires + dev_requires + prod_requires + test_requires + fast_requires,
 }
 
 setup(
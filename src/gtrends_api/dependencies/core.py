@@ -1,6 +1,6 @@
 """Core dependencies for the API."""
 
-from gtrends_core.config import get_trends_client
+from gtrends_core.context import get_trends_context
 from gtrends_core.services.comparison_service import ComparisonService
 from gtrends_core.services.geo_service import GeoService
 from gtrends_core.services.growth_service import GrowthService
@@ -16,8 +16,8 @@ def get_trending_service() -> TrendingService:
     Returns:
         TrendingService: Service for trending searches
     """
-    client = get_trends_client()
-    return TrendingService(client)
+    context = get_trends_context()
+    return TrendingService(context.client, context)
 
 
 def get_related_service() -> RelatedService:
@@ -26,8 +26,8 @@ def get_related_service() -> RelatedService:
     Returns:
         RelatedService: Service for related topics and queries
     """
-    client = get_trends_client()
-    return RelatedService(client)
+    context = get_trends_context()
+    return RelatedService(context.client, context)
 
 
 def get_comparison_service() -> ComparisonService:
@@ -36,8 +36,8 @@ def get_comparison_service() -> ComparisonService:
     Returns:
         ComparisonService: Service for comparing interest across topics
     """
-    client = get_trends_client()
-    return ComparisonService(client)
+    context = get_trends_context()
+    return ComparisonService(context.client, context)
 
 
 def get_suggestion_service() -> SuggestionService:
@@ -46,8 +46,8 @@ def get_suggestion_service() -> SuggestionService:
     Returns:
         SuggestionService: Service for topic suggestions
     """
-    client = get_trends_client()
-    return SuggestionService(client)
+    context = get_trends_context()
+    return SuggestionService(context.client, context)
 
 
 def get_opportunity_service() -> OpportunityService:
@@ -56,8 +56,8 @@ def get_opportunity_service() -> OpportunityService:
     Returns:
         OpportunityService: Service for finding writing opportunities
     """
-    client = get_trends_client()
-    return OpportunityService(client)
+    context = get_trends_context()
+    return OpportunityService(context.client, context)
 
 
 def get_growth_service() -> GrowthService:
@@ -66,8 +66,8 @@ def get_growth_service() -> GrowthService:
     Returns:
         GrowthService: Service for analyzing topic growth
     """
-    client = get_trends_client()
-    return GrowthService(client)
+    context = get_trends_context()
+    return GrowthService(context.client, context)
 
 
 def get_geo_service() -> GeoService:
@@ -76,5 +76,5 @@ def get_geo_service() -> GeoService:
     Returns:
         GeoService: Service for geographical interest analysis
     """
-    client = get_trends_client()
-    return GeoService(client)
+    context = get_trends_context()
+    return GeoService(context.client, context)
@@ -71,7 +71,7 @@ async def get_writing_opportunities(
 
     # Get current region if not specified
     if not region_code:
-        region_code = service.client.get_current_region()
+        region_code = service.get_current_region()
 
     from gtrends_core.utils.helpers import format_region_name
 
@@ -135,7 +135,7 @@ async def post_writing_opportunities(
 
     # Get current region if not specified
     if not region_code:
-        region_code = service.client.get_current_region()
+        region_code = service.get_current_region()
 
     from gtrends_core.utils.helpers import format_region_name
 
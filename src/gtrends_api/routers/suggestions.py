@@ -72,7 +72,7 @@ async def get_topic_suggestions(
     # Get current region if not specified
     if not region_code:
         try:
-            region_code = service.client.get_current_region()
+            region_code = service.get_current_region()
         except (AttributeError, Exception):
             region_code = "US"
 
@@ -137,7 +137,7 @@ async def post_topic_suggestions(
     # Get current region if not specified
     if not region_code:
         try:
-            region_code = service.client.get_current_region()
+            region_code = service.get_current_region()
         except (AttributeError, Exception):
             region_code = "US"
 
@@ -14,10 +14,11 @@ console = Console()
 def categories_command(find: Optional[str]):
     """List available Google Trends categories."""
     try:
-        from gtrends_core.config import get_trends_client
+        from gtrends_core.context import get_trends_context
 
-        # Get trends client
-        client = get_trends_client()
+        # Get the shared trends context and its client
+        context = get_trends_context()
+        client = context.client
 
         # Get categories
         categories = client.get_categories()
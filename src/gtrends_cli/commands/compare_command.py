@@ -7,7 +7,8 @@ from rich.console import Console
 
 from gtrends_cli.formatters.console import format_interest_over_time
 from gtrends_cli.formatters.export import export_data
-from gtrends_core.config import DEFAULT_CATEGORY, get_trends_client
+from gtrends_core.config import DEFAULT_CATEGORY
+from gtrends_core.context import get_trends_context
 from gtrends_core.services.comparison_service import ComparisonService
 from gtrends_core.utils.helpers import format_region_name
 from gtrends_core.utils.validators import (
@@ -65,10 +66,11 @@ def compare_command(
             )
             topics = topics[:5]
 
-        # Get the trends client
-        client = get_trends_client()
+        # Get the shared trends context and its client
+        context = get_trends_context()
+        client = context.client
 
-        service = ComparisonService(client)
+        service = ComparisonService(client, context)
 
         region_code = validate_region_code(region) if region else None
         timeframe_parsed = parse_timeframe(timeframe)
@@ -57,13 +57,14 @@ def geo_interest_command(
 ):
     """Show geographical interest for a search term."""
     try:
-        from gtrends_core.config import get_trends_client
+        from gtrends_core.context import get_trends_context
 
-        # Get trends client
-        client = get_trends_client()
+        # Get the shared trends context and its client
+        context = get_trends_context()
+        client = context.client
 
         # Create service
-        service = GeoService(client)
+        service = GeoService(client, context)
 
         # Validate parameters
         region_code = validate_region_code(region) if region else None
@@ -150,13 +151,14 @@ def geo_interest_command(
 def geo_command(search_term: str):
     """Search for country/region codes matching the search term."""
     try:
-        from gtrends_core.config import get_trends_client
+        from gtrends_core.context import get_trends_context
 
-        # Get trends client
-        client = get_trends_client()
+        # Get the shared trends context and its client
+        context = get_trends_context()
+        client = context.client
 
         # Create service
-        service = GeoService(client)
+        service = GeoService(client, context)
 
         # Search for region codes
         geo_codes = service.get_geo_codes_by_search(search_term)
@@ -41,13 +41,14 @@ def topic_growth_command(
 ):
     """Analyze growth trends for topics over recent time periods."""
     try:
-        from gtrends_core.config import get_trends_client
+        from gtrends_core.context import get_trends_context
 
-        # Get trends client
-        client = get_trends_client()
+        # Get the shared trends context and its client
+        context = get_trends_context()
+        client = context.client
 
         # Create service
-        service = GrowthService(client)
+        service = GrowthService(client, context)
 
         # Convert tuple to list
         topics_list = list(topics)
@@ -46,13 +46,14 @@ def writing_opportunities_command(
 ):
     """Find content writing opportunities based on trending topics and seeds."""
     try:
-        from gtrends_core.config import get_trends_client
+        from gtrends_core.context import get_trends_context
 
-        # Get trends client
-        client = get_trends_client()
+        # Get the shared trends context and its client
+        context = get_trends_context()
+        client = context.client
 
         # Create service
-        service = OpportunityService(client)
+        service = OpportunityService(client, context)
 
         # Validate parameters
         region_code = validate_region_code(region) if region else None
@@ -70,7 +71,7 @@ def writing_opportunities_command(
         )
 
         # Display results
-        region_display = region_code if region_code else client.get_current_region()
+        region_display = region_code if region_code else context.region
         region_name = format_region_name(region_display)
 
         console.print(
@@ -7,7 +7,8 @@ from rich.console import Console
 
 from gtrends_cli.formatters.console import format_trending_searches
 from gtrends_cli.formatters.export import export_data
-from gtrends_core.config import DEFAULT_SUGGESTIONS_COUNT, get_trends_client
+from gtrends_core.config import DEFAULT_SUGGESTIONS_COUNT
+from gtrends_core.context import get_trends_context
 from gtrends_core.services.trending_service import TrendingService
 from gtrends_core.utils.validators import validate_export_path, validate_region_code
 
@@ -45,11 +46,12 @@ def trending_command(
 ):
     """Show current trending searches on Google."""
     try:
-        # Get the trends client
-        client = get_trends_client()
+        # Get the shared trends context and its client
+        context = get_trends_context()
+        client = context.client
 
         # Create service instance with the client
-        service = TrendingService(client)
+        service = TrendingService(client, context)
 
         # Validate region code if provided
         region_code = validate_region_code(region) if region else None
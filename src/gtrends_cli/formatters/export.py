@@ -1,5 +1,6 @@
 """Export formatters for the CLI interface."""
 
+import dataclasses
 import json
 import logging
 from pathlib import Path
@@ -27,17 +28,17 @@ def model_to_dataframe(model: BaseModel) -> Union[pd.DataFrame, Dict[str, pd.Dat
     """
     # Handle different model types
     if isinstance(model, TrendingSearchResults):
-        df = pd.DataFrame([topic.__dict__ for topic in model.topics])
+        df = pd.DataFrame([topic.to_dict() for topic in model.topics])
         return df
 
     elif isinstance(model, RelatedTopicResults):
-        top_df = pd.DataFrame([topic.__dict__ for topic in model.top_topics])
-        rising_df = pd.DataFrame([topic.__dict__ for topic in model.rising_topics])
+        top_df = pd.DataFrame([topic.to_dict() for topic in model.top_topics])
+        rising_df = pd.DataFrame([topic.to_dict() for topic in model.rising_topics])
         return {"top_topics": top_df, "rising_topics": rising_df}
 
     elif isinstance(model, RelatedQueryResults):
-        top_df = pd.DataFrame([query.__dict__ for query in model.top_queries])
-        rising_df = pd.DataFrame([query.__dict__ for query in model.rising_queries])
+        top_df = pd.DataFrame([query.to_dict() for query in model.top_queries])
+        rising_df = pd.DataFrame([query.to_dict() for query in model.rising_queries])
         return {"top_queries": top_df, "rising_queries": rising_df}
 
     elif isinstance(model, InterestOverTimeResult):
@@ -143,9 +144,10 @@ def model_to_dataframe(model: BaseModel) -> Union[pd.DataFrame, Dict[str, pd.Dat
 
         except Exception as e:
             logger.error(f"Error converting model to DataFrame: {e}")
-            # Fallback: try to create a DataFrame from the model's __dict__
+            # Fallback: try to create a DataFrame from the model's fields (works for
+            # slotted models, which have no __dict__)
             try:
-                return pd.DataFrame([model.__dict__])
+                return pd.DataFrame([dataclasses.asdict(model)])
             except Exception as e:
                 # Last resort: create a DataFrame with just the string representation
                 logger.error(f"Error converting model to DataFrame: {e}")
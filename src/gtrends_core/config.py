@@ -1,15 +1,24 @@
 """Configuration settings for the Google Trends Core library."""
 
+import functools
 import logging
 import os
-import time
+import threading
 from enum import Enum
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Union
 
 import pandas as pd
-import requests
 import trendspy
+from requests.adapters import HTTPAdapter
+from trendspy.client import REALTIME_RSS
+from trendspy.converter import TrendsDataConverter
+from trendspy.trend_keyword import TrendKeywordLite
+from urllib3.util.retry import Retry
+
+from gtrends_core.utils.http_cache import ConditionalRequestCache
+from gtrends_core.utils.ratelimit import TRENDS_BUCKET
+from gtrends_core.utils.retry import is_rate_limited, retry_on_429
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -59,12 +68,42 @@ class BatchPeriod(str, Enum):
 # API configuration
 API_DEFAULT_TIMEOUT = 30  # seconds
 API_MAX_RETRIES = 3
+TRANSIENT_STATUS_CODES = (500, 502, 503, 504)  # Retried by the transport, unlike 429
 API_RATE_LIMIT = 60  # requests per minute
 
 # CLI configuration
 CLI_DEFAULT_OUTPUT_FORMAT = "text"
 
 
+class _SerializedTrends:
+    """Proxy to a TrendsPy client that runs one method call at a time.
+
+    TrendsPy keeps per-instance request timing and a requests session that are not
+    thread-safe, so calls from concurrent threads must not interleave.
+    """
+
+    def __init__(self, trends: trendspy.Trends):
+        """Wrap a TrendsPy client.
+
+        Args:
+            trends: TrendsPy client to serialize access to
+        """
+        self._trends = trends
+        self.lock = threading.RLock()
+
+    def __getattr__(self, name: str):
+        attr = getattr(self._trends, name)
+        if not callable(attr):
+            return attr
+
+        @functools.wraps(attr)
+        def serialized(*args, **kwargs):
+            with self.lock:
+                return attr(*args, **kwargs)
+
+        return serialized
+
+
 class TrendsClient:
     """Client for interacting with Google Trends API using TrendsPy."""
 
@@ -81,29 +120,39 @@ class TrendsClient:
             hl: Language parameter
             tz: Timezone offset (360 corresponds to US CST)
             timeout: Request timeout in seconds
-            retries: Number of request retries
+            retries: Number of retries for connection errors and 5xx responses
         """
-        self.trends = trendspy.Trends(hl=hl, tz=tz, timeout=timeout, retries=retries)
-        self._session = requests.Session()
-        self._last_request_time = 0
+        # TrendsPy retries 429 responses internally with its own sleeps; make a single
+        # attempt there so rate limits are only backed off once, by retry_on_429
+        trends = trendspy.Trends(hl=hl, tz=tz, timeout=timeout, max_retries=1)
+
+        # Connection errors and 5xx responses are retried by the session's transport
+        # instead, since TrendsPy no longer does
+        transient_retry = Retry(
+            total=retries,
+            status_forcelist=TRANSIENT_STATUS_CODES,
+            allowed_methods=None,
+            backoff_factor=0.5,
+            raise_on_status=False,
+        )
+        trends.session.mount("https://", HTTPAdapter(max_retries=transient_retry))
+        self.trends = _SerializedTrends(trends)
+        self.timeout = timeout
+
+        # ETag/Last-Modified cache for polling the trending RSS feed
+        self._http_cache = ConditionalRequestCache()
 
         # Cache for categories and geo data
         self._categories_cache = None
         self._geo_cache = {}
 
-    def _throttle_requests(self, min_interval: float = 1.0):
-        """Prevent sending too many requests in a short time.
+    def _throttle_requests(self):
+        """Wait for the shared Google Trends rate limiter before sending a request.
 
-        Args:
-            min_interval: Minimum time between requests in seconds
+        The limiter is shared across threads and client instances, so concurrent
+        callers stay within the same aggregate request rate.
         """
-        current_time = time.time()
-        time_since_last = current_time - self._last_request_time
-
-        if time_since_last < min_interval:
-            time.sleep(min_interval - time_since_last)
-
-        self._last_request_time = time.time()
+        TRENDS_BUCKET.acquire()
 
     def get_current_region(self) -> str:
         """Determine the user's current region based on IP.
@@ -111,15 +160,12 @@ class TrendsClient:
         Returns:
             Two-letter country code
         """
-        try:
-            self._throttle_requests()
-            response = self._session.get("https://ipinfo.io/json", timeout=5)
-            data = response.json()
-            return data.get("country", DEFAULT_REGION)
-        except Exception:
-            # Fallback to default region on any error
-            return DEFAULT_REGION
+        # Imported here since utils.net depends on this module for DEFAULT_REGION
+        from gtrends_core.utils.net import get_current_region_cached
+
+        return get_current_region_cached()
 
+    @retry_on_429()
     def get_categories(self, find: Optional[str] = None) -> List[Dict[str, str]]:
         """Get available Google Trends categories, optionally filtered by search term.
 
@@ -139,6 +185,7 @@ class TrendsClient:
 
         return self._categories_cache
 
+    @retry_on_429()
     def get_region_codes(self) -> pd.DataFrame:
         """Get all available region codes.
 
@@ -197,6 +244,36 @@ class TrendsClient:
             print(f"Error in get_trending_searches: {str(e)}")
             return pd.DataFrame(columns=["rank", "title", "traffic", "news_tokens"])
 
+    @retry_on_429()
+    def fetch_trending_rss(self, geo: str) -> List:
+        """Fetch the trending RSS feed using a conditional request.
+
+        Unchanged feeds are answered with 304 Not Modified and parsed from the cached body.
+        Unlike trending_now_by_rss, errors are raised to the caller.
+
+        Args:
+            geo: Two-letter country code
+
+        Returns:
+            List of TrendKeywordLite objects with news articles
+        """
+        self._throttle_requests()
+
+        try:
+            # The request goes through the TrendsPy session, so hold its lock too
+            with self.trends.lock:
+                rss_text = self._http_cache.get(
+                    self.trends.session, REALTIME_RSS, params={"geo": geo}, timeout=self.timeout
+                )
+        except Exception as e:
+            if is_rate_limited(e):
+                # Let retry_on_429 back off instead of re-requesting right away
+                raise
+            logger.debug(f"Conditional RSS request failed, using TrendsPy directly: {str(e)}")
+            return self.trends.trending_now_by_rss(geo=geo)
+
+        return [TrendKeywordLite.from_api(item) for item in TrendsDataConverter.rss_items(rss_text)]
+
     def trending_now_by_rss(self, geo: Optional[str] = None) -> List:
         """Get trending searches with news articles using RSS feed.
 
@@ -209,10 +286,8 @@ class TrendsClient:
         if geo is None:
             geo = self.get_current_region()
 
-        self._throttle_requests()
-
         try:
-            return self.trends.trending_now_by_rss(geo=geo)
+            return self.fetch_trending_rss(geo)
         except Exception as e:
             logger.error(f"Error in trending_now_by_rss: {str(e)}")
             return []
@@ -232,11 +307,9 @@ class TrendsClient:
         if region is None:
             region = self.get_current_region()
 
-        self._throttle_requests()
-
         try:
             # Get trending searches with news
-            trending = self.trends.trending_now_by_rss(geo=region)
+            trending = self.fetch_trending_rss(region)
 
             # Convert to DataFrame for consistent interface
             data = []
@@ -271,6 +344,7 @@ class TrendsClient:
             logger.error(f"Error in get_trending_searches_with_articles: {str(e)}")
             return pd.DataFrame(columns=["rank", "title", "traffic", "news_tokens"]), {}
 
+    @retry_on_429()
     def get_related_topics(
         self,
         query: str,
@@ -309,6 +383,7 @@ class TrendsClient:
 
         return result
 
+    @retry_on_429()
     def get_related_queries(
         self,
         query: str,
@@ -347,6 +422,7 @@ class TrendsClient:
 
         return result
 
+    @retry_on_429()
     def get_interest_over_time(
         self,
         queries: Union[str, List[str]],
@@ -385,6 +461,7 @@ class TrendsClient:
 
         return interest_df
 
+    @retry_on_429()
     def get_interest_by_region(
         self,
         queries: Union[str, List[str]],
@@ -0,0 +1,138 @@
+"""Shared request context for Google Trends services."""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+import pandas as pd
+
+from gtrends_core.config import DEFAULT_CATEGORY, DEFAULT_TIMEFRAME, get_trends_client
+from gtrends_core.utils.net import get_current_region_cached
+
+# Trending searches and related topics are cached per context
+CONTEXT_CACHE_SIZE = 512
+CONTEXT_CACHE_TTL = 900  # 15 minutes
+
+
+class TrendsContext:
+    """Resolve and cache data shared by services working with the same TrendsClient.
+
+    This is the single place services get the user's region and cached trending
+    searches and related topics from. Services built from the same context (see
+    get_trends_context) only fetch each of them once per cache period.
+    """
+
+    def __init__(self, trends_client, region: Optional[str] = None):
+        """Initialize the context.
+
+        Args:
+            trends_client: Initialized TrendsClient instance
+            region: Two-letter country code (or None to auto-detect from the IP)
+        """
+        self.client = trends_client
+        self._region = region
+        self._cache: "OrderedDict[Hashable, Tuple[Any, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def region(self) -> str:
+        """Two-letter country code of the user, detected from the IP unless given."""
+        return self._region or get_current_region_cached()
+
+    def _cached(
+        self,
+        key: Hashable,
+        fetch: Callable[[], Any],
+        should_cache: Optional[Callable[[Any], bool]] = None,
+    ) -> Any:
+        """Get a value through the context's bounded LRU cache with expiry.
+
+        Args:
+            key: Cache key
+            fetch: Function called to get the value on a cache miss
+            should_cache: Predicate deciding whether a fetched value is stored
+                (all values are stored if not provided)
+
+        Returns:
+            Cached or freshly fetched value
+        """
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is not None and entry[1] > time.monotonic():
+                self._cache.move_to_end(key)
+                return entry[0]
+
+        value = fetch()
+        if should_cache is not None and not should_cache(value):
+            return value
+
+        with self._lock:
+            self._cache[key] = (value, time.monotonic() + CONTEXT_CACHE_TTL)
+            self._cache.move_to_end(key)
+            while len(self._cache) > CONTEXT_CACHE_SIZE:
+                self._cache.popitem(last=False)
+
+        return value
+
+    def trending_df(self, region: Optional[str] = None) -> pd.DataFrame:
+        """Get trending searches for a region, reusing recent results.
+
+        Args:
+            region: Two-letter country code (or None to use the context region)
+
+        Returns:
+            DataFrame of trending searches
+        """
+        region = region or self.region
+        # The client returns an empty frame when the request fails, which must not be
+        # served as "no trends" for the whole cache period
+        return self._cached(
+            ("trending", region),
+            lambda: self.client.get_trending_searches(region=region),
+            should_cache=lambda df: not df.empty,
+        )
+
+    def related_topics(
+        self,
+        query: str,
+        region: Optional[str] = None,
+        timeframe: str = DEFAULT_TIMEFRAME,
+        category: str = DEFAULT_CATEGORY,
+    ) -> Dict[str, pd.DataFrame]:
+        """Get topics related to a query, reusing recent results for the same arguments.
+
+        Args:
+            query: Search term
+            region: Two-letter country code (or None to use the context region)
+            timeframe: Time range for data
+            category: Category ID to filter results
+
+        Returns:
+            Dictionary with 'top' and 'rising' DataFrames
+        """
+        region = region or self.region
+        return self._cached(
+            ("related_topics", query, region, timeframe, category),
+            lambda: self.client.get_related_topics(
+                query=query, region=region, timeframe=timeframe, category=category
+            ),
+        )
+
+
+_default_context: Optional[TrendsContext] = None
+_default_context_lock = threading.Lock()
+
+
+def get_trends_context() -> TrendsContext:
+    """Get the process-wide TrendsContext shared by the CLI commands and API routes.
+
+    Returns:
+        TrendsContext wrapping a configured TrendsClient, created on first use
+    """
+    global _default_context
+
+    with _default_context_lock:
+        if _default_context is None:
+            _default_context = TrendsContext(get_trends_client())
+        return _default_context
@@ -3,10 +3,14 @@
 This module provides base classes that can be inherited by specific data models.
 """
 
-from dataclasses import dataclass, field
+import sys
+from dataclasses import dataclass, field, fields
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
+# Slotted dataclasses need Python 3.10+, older versions fall back to regular instances
+_SLOTS: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 @dataclass(frozen=True)
 class BaseModel:
@@ -15,9 +19,11 @@ class BaseModel:
     Provides common functionality like string representation and dictionary conversion.
     """
 
+    __slots__ = ()
+
     def __str__(self) -> str:
         """Return a string representation of the model."""
-        attrs = [f"{key}={value}" for key, value in self.__dict__.items()]
+        attrs = [f"{f.name}={getattr(self, f.name)}" for f in fields(self)]
         return f"{self.__class__.__name__}({', '.join(attrs)})"
 
     def __repr__(self) -> str:
@@ -26,7 +32,7 @@ class BaseModel:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert the model to a dictionary."""
-        return {key: value for key, value in self.__dict__.items()}
+        return {f.name: getattr(self, f.name) for f in fields(self)}
 
 
 @dataclass(frozen=True)
@@ -109,7 +115,7 @@ class TrendingTopic(BaseModel):
         return ", ".join(parts)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class RelatedTopic(BaseModel):
     """Model for a topic related to a search query."""
 
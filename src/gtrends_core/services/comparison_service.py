@@ -1,15 +1,14 @@
 """Comparison service for comparing interest in multiple topics from Google Trends."""
 
 import logging
-import time
 from datetime import datetime
 from pathlib import Path
 from typing import List, Optional, Union
 
 import pandas as pd
-import requests
 
-from gtrends_core.config import DEFAULT_CATEGORY, DEFAULT_REGION, DEFAULT_TIMEFRAME
+from gtrends_core.config import DEFAULT_CATEGORY, DEFAULT_TIMEFRAME
+from gtrends_core.context import TrendsContext
 from gtrends_core.exceptions.trends_exceptions import ApiRequestException, NoDataException
 from gtrends_core.models.base import RegionInterest, TimePoint
 from gtrends_core.models.comparison import InterestByRegionResult, InterestOverTimeResult
@@ -21,29 +20,15 @@ logger = logging.getLogger(__name__)
 class ComparisonService:
     """Service for comparing interest across different topics."""
 
-    def __init__(self, trends_client):
+    def __init__(self, trends_client, context: Optional[TrendsContext] = None):
         """Initialize with a TrendsClient instance.
 
         Args:
             trends_client: Initialized TrendsClient instance
+            context: Shared TrendsContext (a new one is created if not provided)
         """
         self.client = trends_client
-        self._session = requests.Session()
-        self._last_request_time = 0
-
-    def _throttle_requests(self, min_interval: float = 1.0):
-        """Prevent sending too many requests in a short time.
-
-        Args:
-            min_interval: Minimum time between requests in seconds
-        """
-        current_time = time.time()
-        time_since_last = current_time - self._last_request_time
-
-        if time_since_last < min_interval:
-            time.sleep(min_interval - time_since_last)
-
-        self._last_request_time = time.time()
+        self.context = context or TrendsContext(trends_client)
 
     def get_current_region(self) -> str:
         """Determine the user's current region based on IP.
@@ -51,15 +36,7 @@ class ComparisonService:
         Returns:
             Two-letter country code
         """
-        try:
-            self._throttle_requests()
-            response = self._session.get("https://ipinfo.io/json", timeout=5)
-            data = response.json()
-            return data.get("country", DEFAULT_REGION)
-        except Exception as e:
-            # Fallback to default region on any error
-            logger.warning(f"Failed to detect region: {str(e)}")
-            return DEFAULT_REGION
+        return self.context.region
 
     def get_interest_over_time(
         self,
@@ -1,13 +1,11 @@
 """Service for geographical interest analysis based on Google Trends data."""
 
 import logging
-import time
 from typing import Optional
 
 import pandas as pd
-import requests
 
-from gtrends_core.config import DEFAULT_REGION
+from gtrends_core.context import TrendsContext
 from gtrends_core.exceptions.trends_exceptions import InvalidParameterException
 from gtrends_core.utils.validators import validate_region_code
 
@@ -17,29 +15,15 @@ logger = logging.getLogger(__name__)
 class GeoService:
     """Service for analyzing geographical interest from Google Trends data."""
 
-    def __init__(self, trends_client):
+    def __init__(self, trends_client, context: Optional[TrendsContext] = None):
         """Initialize with a TrendsClient instance.
 
         Args:
             trends_client: Initialized TrendsClient instance
+            context: Shared TrendsContext (a new one is created if not provided)
         """
         self.client = trends_client
-        self._session = requests.Session()
-        self._last_request_time = 0
-
-    def _throttle_requests(self, min_interval: float = 1.0):
-        """Prevent sending too many requests in a short time.
-
-        Args:
-            min_interval: Minimum time between requests in seconds
-        """
-        current_time = time.time()
-        time_since_last = current_time - self._last_request_time
-
-        if time_since_last < min_interval:
-            time.sleep(min_interval - time_since_last)
-
-        self._last_request_time = time.time()
+        self.context = context or TrendsContext(trends_client)
 
     def get_current_region(self) -> str:
         """Determine the user's current region based on IP.
@@ -47,15 +31,7 @@ class GeoService:
         Returns:
             Two-letter country code
         """
-        try:
-            self._throttle_requests()
-            response = self._session.get("https://ipinfo.io/json", timeout=5)
-            data = response.json()
-            return data.get("country", DEFAULT_REGION)
-        except Exception as e:
-            # Fallback to default region on any error
-            logger.warning(f"Failed to detect region: {str(e)}")
-            return DEFAULT_REGION
+        return self.context.region
 
     def get_interest_by_region(
         self,
@@ -86,10 +62,7 @@ class GeoService:
         if region:
             region = validate_region_code(region)
         else:
-            try:
-                region = self.client.get_current_region()
-            except (AttributeError, Exception):
-                region = self.get_current_region()
+            region = self.get_current_region()
 
         if resolution not in ["COUNTRY", "REGION", "CITY", "DMA"]:
             raise InvalidParameterException(
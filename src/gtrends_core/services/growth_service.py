@@ -1,14 +1,12 @@
 """Service for analyzing topic growth trends over time."""
 
 import logging
-import time
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 import pandas as pd
-import requests
 from trendspy import BatchPeriod
 
-from gtrends_core.config import DEFAULT_REGION
+from gtrends_core.context import TrendsContext
 from gtrends_core.exceptions.trends_exceptions import InvalidParameterException
 
 logger = logging.getLogger(__name__)
@@ -17,29 +15,15 @@ logger = logging.getLogger(__name__)
 class GrowthService:
     """Service for analyzing growth trends of topics over time."""
 
-    def __init__(self, trends_client):
+    def __init__(self, trends_client, context: Optional[TrendsContext] = None):
         """Initialize with a TrendsClient instance.
 
         Args:
             trends_client: Initialized TrendsClient instance
+            context: Shared TrendsContext (a new one is created if not provided)
         """
         self.client = trends_client
-        self._session = requests.Session()
-        self._last_request_time = 0
-
-    def _throttle_requests(self, min_interval: float = 1.0):
-        """Prevent sending too many requests in a short time.
-
-        Args:
-            min_interval: Minimum time between requests in seconds
-        """
-        current_time = time.time()
-        time_since_last = current_time - self._last_request_time
-
-        if time_since_last < min_interval:
-            time.sleep(min_interval - time_since_last)
-
-        self._last_request_time = time.time()
+        self.context = context or TrendsContext(trends_client)
 
     def get_current_region(self) -> str:
         """Determine the user's current region based on IP.
@@ -47,15 +31,7 @@ class GrowthService:
         Returns:
             Two-letter country code
         """
-        try:
-            self._throttle_requests()
-            response = self._session.get("https://ipinfo.io/json", timeout=5)
-            data = response.json()
-            return data.get("country", DEFAULT_REGION)
-        except Exception as e:
-            # Fallback to default region on any error
-            logger.warning(f"Failed to detect region: {str(e)}")
-            return DEFAULT_REGION
+        return self.context.region
 
     def get_topic_growth_data(self, topics: List[str], time_period: str = "24h") -> pd.DataFrame:
         """Get growth data for multiple topics over a specified time period.
@@ -88,44 +64,41 @@ class GrowthService:
                 logger.warning("No growth data returned from the API")
                 return empty_df
 
-            # Process results
-            result_data = []
+            col_set = set(growth_data.columns)
+
+            # Order the timeline once so each topic's first and last values can be read directly
+            time_column = next((col for col in ("timestamp", "date") if col in col_set), None)
+            time_values = growth_data[time_column] if time_column else growth_data.index
+            if not time_values.is_monotonic_increasing:
+                if time_column:
+                    growth_data = growth_data.sort_values(by=time_column, kind="stable")
+                else:
+                    growth_data = growth_data.sort_index(kind="stable")
+
+            # Resolve where each topic's data lives once, instead of per topic
+            query_index = growth_data.groupby("query").indices if "query" in col_set else {}
+
+            col_topics = [topic for topic in topics if topic in col_set]
+            query_topics = [
+                topic for topic in topics if topic not in col_set and topic in query_index
+            ]
 
             # Calculate metrics for each topic
-            for topic in topics:
-                try:
-                    # Filter data for this topic
-                    if topic in growth_data.columns:
-                        topic_data = growth_data[topic].reset_index()
-                    else:
-                        topic_df = (
-                            growth_data[growth_data["query"] == topic]
-                            if "query" in growth_data.columns
-                            else pd.DataFrame()
-                        )
-                        if topic_df.empty:
-                            continue
-                        topic_data = topic_df.reset_index()
-
-                    if not topic_data.empty:
-                        # Calculate growth metrics
-                        start_value, end_value, growth_pct = self._calculate_growth_metrics(
-                            topic_data
-                        )
-
-                        # Add to results
-                        result_data.append(
-                            {
-                                "topic": topic,
-                                "start_value": start_value,
-                                "end_value": end_value,
-                                "growth_pct": growth_pct,
-                                "trend": self._determine_trend(growth_pct),
-                                "period": time_period,
-                            }
-                        )
-                except Exception as e:
-                    logger.warning(f"Error processing growth data for topic {topic}: {e}")
+            result_data = []
+
+            for topic in col_topics:
+                topic_values = growth_data[topic]
+                if not topic_values.empty:
+                    result_data.append(self._build_growth_row(topic, topic_values, time_period))
+
+            no_values = pd.Series(dtype=float)
+            for topic in query_topics:
+                topic_values = (
+                    growth_data["value"].iloc[query_index[topic]]
+                    if "value" in col_set
+                    else no_values
+                )
+                result_data.append(self._build_growth_row(topic, topic_values, time_period))
 
             # Create DataFrame with results
             if result_data:
@@ -143,6 +116,28 @@ class GrowthService:
             logger.error(f"Error getting topic growth data: {e}")
             return empty_df
 
+    def _build_growth_row(self, topic: str, topic_values: pd.Series, time_period: str) -> dict:
+        """Build the result row for a single topic.
+
+        Args:
+            topic: Topic name
+            topic_values: The topic's values over time, in chronological order
+            time_period: Time period that was analyzed
+
+        Returns:
+            Dictionary with the topic's growth metrics
+        """
+        start_value, end_value, growth_pct = self._calculate_growth_metrics(topic_values)
+
+        return {
+            "topic": topic,
+            "start_value": start_value,
+            "end_value": end_value,
+            "growth_pct": growth_pct,
+            "trend": self._determine_trend(growth_pct),
+            "period": time_period,
+        }
+
     def _convert_to_batch_period(self, period: str) -> BatchPeriod:
         """Convert a string time period to a BatchPeriod enum.
 
@@ -187,37 +182,21 @@ class GrowthService:
 
         return period_map.get(batch_period, "now 1-d")
 
-    def _calculate_growth_metrics(self, topic_data: pd.DataFrame) -> Tuple[float, float, float]:
+    def _calculate_growth_metrics(self, topic_values: pd.Series) -> Tuple[float, float, float]:
         """Calculate growth metrics for a topic.
 
         Args:
-            topic_data: DataFrame containing the topic's data over time
+            topic_values: The topic's values over time, in chronological order
 
         Returns:
             Tuple containing (start_value, end_value, growth_percentage)
         """
-        # Find the value column
-        value_column = None
-        for col in topic_data.columns:
-            if col in [
-                "value",
-                0,
-            ]:  # The column might be named "value" or just be the first numeric column
-                value_column = col
-                break
-
-        if not value_column:
+        if topic_values.empty:
             return 0.0, 0.0, 0.0
 
-        # Sort by timestamp or date if available, otherwise use the index
-        if "timestamp" in topic_data.columns:
-            topic_data = topic_data.sort_values(by="timestamp")
-        elif "date" in topic_data.columns:
-            topic_data = topic_data.sort_values(by="date")
-
         # Get the first and last values
-        start_value = float(topic_data[value_column].iloc[0])
-        end_value = float(topic_data[value_column].iloc[-1])
+        start_value = float(topic_values.iat[0])
+        end_value = float(topic_values.iat[-1])
 
         # Calculate growth percentage
         if start_value == 0:
@@ -1,44 +1,36 @@
 """Service for identifying writing opportunities based on Google Trends data."""
 
 import logging
-import time
 from typing import List, Optional
 
 import pandas as pd
-import requests
 
-from gtrends_core.config import DEFAULT_REGION
+from gtrends_core.context import TrendsContext
 from gtrends_core.utils.validators import validate_region_code
 
+try:
+    import ahocorasick
+except ImportError:  # Optional dependency (pyahocorasick)
+    ahocorasick = None
+
 logger = logging.getLogger(__name__)
 
+# Below this many seeds a plain substring scan is cheaper than building an automaton
+AUTOMATON_MIN_SEEDS = 4
+
 
 class OpportunityService:
     """Service for identifying content creation opportunities based on Google Trends data."""
 
-    def __init__(self, trends_client):
+    def __init__(self, trends_client, context: Optional[TrendsContext] = None):
         """Initialize with a TrendsClient instance.
 
         Args:
             trends_client: Initialized TrendsClient instance
+            context: Shared TrendsContext (a new one is created if not provided)
         """
         self.client = trends_client
-        self._session = requests.Session()
-        self._last_request_time = 0
-
-    def _throttle_requests(self, min_interval: float = 1.0):
-        """Prevent sending too many requests in a short time.
-
-        Args:
-            min_interval: Minimum time between requests in seconds
-        """
-        current_time = time.time()
-        time_since_last = current_time - self._last_request_time
-
-        if time_since_last < min_interval:
-            time.sleep(min_interval - time_since_last)
-
-        self._last_request_time = time.time()
+        self.context = context or TrendsContext(trends_client)
 
     def get_current_region(self) -> str:
         """Determine the user's current region based on IP.
@@ -46,15 +38,7 @@ class OpportunityService:
         Returns:
             Two-letter country code
         """
-        try:
-            self._throttle_requests()
-            response = self._session.get("https://ipinfo.io/json", timeout=5)
-            data = response.json()
-            return data.get("country", DEFAULT_REGION)
-        except Exception as e:
-            # Fallback to default region on any error
-            logger.warning(f"Failed to detect region: {str(e)}")
-            return DEFAULT_REGION
+        return self.context.region
 
     def get_writing_opportunities(
         self,
@@ -81,10 +65,7 @@ class OpportunityService:
         if region:
             region = validate_region_code(region)
         else:
-            try:
-                region = self.client.get_current_region()
-            except (AttributeError, Exception):
-                region = self.get_current_region()
+            region = self.context.region
 
         # Use default seed topics if none provided
         if not seed_topics or len(seed_topics) == 0:
@@ -92,7 +73,7 @@ class OpportunityService:
 
         # First, try to get trending searches
         try:
-            trending_df = self.client.get_trending_searches(region=region)
+            trending_df = self.context.trending_df(region)
             if trending_df.empty or "title" not in trending_df.columns:
                 trending_df = pd.DataFrame(columns=["title"])
         except Exception as e:
@@ -100,11 +81,11 @@ class OpportunityService:
             trending_df = pd.DataFrame(columns=["title"])
 
         # Second, get related topics for each seed
-        related_data = []
+        related_frames = []
 
         for seed in seed_topics:
             try:
-                related_topics = self.client.get_related_topics(
+                related_topics = self.context.related_topics(
                     query=seed, region=region, timeframe=timeframe
                 )
 
@@ -113,86 +94,87 @@ class OpportunityService:
                     rising_df = related_topics["rising"]
 
                     if "topic_title" in rising_df.columns:
-                        for _, row in rising_df.iterrows():
-                            title = row["topic_title"]
-                            value = row["value"]
-
-                            # Only add if not already in our list
-                            if not any(r["topic"] == title for r in related_data):
-                                related_data.append(
-                                    {
-                                        "topic": title,
-                                        "growth_score": value,
-                                        "opportunity_score": self._calculate_opportunity_score(
-                                            title, trending_df, value
-                                        ),
-                                        "related_to": seed,
-                                    }
-                                )
+                        related_frames.append(
+                            pd.DataFrame(
+                                {
+                                    "topic": rising_df["topic_title"].to_numpy(),
+                                    "growth_score": rising_df["value"].to_numpy(),
+                                    "related_to": seed,
+                                }
+                            )
+                        )
             except Exception as e:
                 logger.warning(f"Error getting related topics for {seed}: {e}")
 
+        # Score all related topics at once, keeping the first seed a topic appeared for
+        if related_frames:
+            related_df = pd.concat(related_frames, ignore_index=True).drop_duplicates(
+                subset="topic", ignore_index=True
+            )
+            related_df["opportunity_score"] = self._calculate_opportunity_scores(
+                related_df["topic"], related_df["growth_score"], trending_df
+            )
+        else:
+            related_df = pd.DataFrame(
+                columns=["topic", "growth_score", "related_to", "opportunity_score"]
+            )
+
         # Find opportunities in trending searches if we don't have enough
-        if len(related_data) < count and not trending_df.empty and "title" in trending_df.columns:
-            for _, row in trending_df.iterrows():
-                title = row["title"]
+        if len(related_df) < count and not trending_df.empty and "title" in trending_df.columns:
+            seed_matcher = self._build_seed_matcher(seed_topics)
+            seen_topics = set(related_df["topic"])
+            trending_data = []
 
+            for title in trending_df["title"]:
                 # Skip if already in our list
-                if any(r["topic"] == title for r in related_data):
+                if title in seen_topics:
                     continue
+                seen_topics.add(title)
 
                 # Find most related seed topic
-                best_seed = self._find_best_seed_match(title, seed_topics)
-
-                # Calculate a synthetic opportunity score
-                opportunity_score = 75  # Trending items start with a high base score
+                best_seed = self._find_best_seed_match(title, seed_topics, seed_matcher)
 
-                related_data.append(
+                trending_data.append(
                     {
                         "topic": title,
                         "growth_score": 100,  # It's trending, so maximum growth score
-                        "opportunity_score": opportunity_score,
                         "related_to": best_seed,
+                        "opportunity_score": 75,  # Trending items start with a high base score
                     }
                 )
 
                 # Stop if we have enough
-                if len(related_data) >= count:
+                if len(related_df) + len(trending_data) >= count:
                     break
 
-        # Generate article ideas for each opportunity
-        opportunity_data = []
-
-        for item in related_data:
-            topic = item["topic"]
-            related_to = item["related_to"]
-
-            # Generate a writing suggestion
-            suggestion = self._generate_writing_suggestion(topic, related_to)
+            if trending_data:
+                trending_items = pd.DataFrame(trending_data)
+                related_df = (
+                    pd.concat([related_df, trending_items], ignore_index=True)
+                    if not related_df.empty
+                    else trending_items
+                )
 
-            opportunity_data.append(
-                {
-                    "topic": topic,
-                    "opportunity_score": item["opportunity_score"],
-                    "growth_score": item["growth_score"],
-                    "article_idea": suggestion,
-                    "related_to": related_to,
-                }
+        # Return empty DataFrame if no results
+        if related_df.empty:
+            return pd.DataFrame(
+                columns=["topic", "opportunity_score", "growth_score", "article_idea", "related_to"]
             )
 
-        # Create DataFrame and sort by opportunity score
-        if opportunity_data:
-            opportunities_df = pd.DataFrame(opportunity_data)
-            opportunities_df = opportunities_df.sort_values(
-                by="opportunity_score", ascending=False
-            ).reset_index(drop=True)
-
-            return opportunities_df.head(count)
-
-        # Return empty DataFrame if no results
-        return pd.DataFrame(
-            columns=["topic", "opportunity_score", "growth_score", "article_idea", "related_to"]
+        # Sort by opportunity score and generate article ideas only for the kept rows
+        opportunities_df = (
+            related_df.sort_values(by="opportunity_score", ascending=False, kind="stable")
+            .head(count)
+            .reset_index(drop=True)
         )
+        opportunities_df["article_idea"] = [
+            self._generate_writing_suggestion(topic, related_to)
+            for topic, related_to in zip(opportunities_df["topic"], opportunities_df["related_to"])
+        ]
+
+        return opportunities_df[
+            ["topic", "opportunity_score", "growth_score", "article_idea", "related_to"]
+        ]
 
     def _get_default_seeds(self) -> List[str]:
         """Get default seed topics when none are provided.
@@ -202,54 +184,77 @@ class OpportunityService:
         """
         return ["technology", "business", "health", "education", "entertainment"]
 
-    def _calculate_opportunity_score(
-        self, topic: str, trending_df: pd.DataFrame, growth_value: float
-    ) -> float:
-        """Calculate an opportunity score for a topic.
+    def _calculate_opportunity_scores(
+        self, topics: pd.Series, growth_values: pd.Series, trending_df: pd.DataFrame
+    ) -> pd.Series:
+        """Calculate opportunity scores for a batch of topics.
 
-        The score is based on growth and whether it appears in trending searches.
+        The score is based on growth and whether the topic appears in trending searches.
 
         Args:
-            topic: The topic to score
+            topics: Topics to score
+            growth_values: Growth values from related topics, aligned with topics
             trending_df: DataFrame of trending searches
-            growth_value: The growth value from related topics
 
         Returns:
-            Opportunity score from 0-100
+            Series of opportunity scores from 0-100
         """
-        # Base score from growth value, normalized to 0-60 range
-        try:
-            growth_value_float = float(growth_value)
-            base_score = min(60, (growth_value_float / 100) * 60)
-        except (ValueError, TypeError):
-            # Handle "Breakout" or other non-numeric values
-            base_score = 60  # Assume maximum base score for "Breakout"
+        # Base score from growth value, normalized to 0-60 range.
+        # "Breakout" or other non-numeric values get the maximum base score.
+        growth = pd.to_numeric(growth_values, errors="coerce")
+        base_scores = (growth / 100 * 60).clip(upper=60).fillna(60)
 
         # Check if topic is in trending searches (exact or partial match)
-        trending_bonus = 0
+        trending_bonus = pd.Series(0, index=topics.index)
         if not trending_df.empty and "title" in trending_df.columns:
-            trending_topics = trending_df["title"].str.lower().tolist()
-            topic_lower = topic.lower()
-
-            # Check for exact match
-            if topic_lower in trending_topics:
-                trending_bonus = 40  # Maximum bonus
-            else:
-                # Check for partial matches
-                for trending_topic in trending_topics:
-                    if topic_lower in trending_topic or trending_topic in topic_lower:
-                        trending_bonus = 20  # Partial match bonus
-                        break
+            trending_topics = trending_df["title"].astype(str).str.lower().tolist()
+            topics_lower = topics.astype(str).str.lower()
+
+            exact = topics_lower.isin(set(trending_topics))
+            partial = pd.Series(
+                [
+                    not is_exact
+                    and any(topic in trending or trending in topic for trending in trending_topics)
+                    for topic, is_exact in zip(topics_lower, exact)
+                ],
+                index=topics.index,
+            )
+            # Maximum bonus for exact matches, partial match bonus otherwise
+            trending_bonus = exact * 40 + partial * 20
 
         # Combine scores, cap at 100
-        return min(100, base_score + trending_bonus)
+        return (base_scores + trending_bonus).clip(upper=100)
 
-    def _find_best_seed_match(self, topic: str, seed_topics: List[str]) -> str:
+    def _build_seed_matcher(self, seed_topics: List[str]):
+        """Build an Aho-Corasick automaton over the seed topics.
+
+        Args:
+            seed_topics: List of seed topics
+
+        Returns:
+            Automaton mapping each lowercased seed to (position, seed), or None when
+            pyahocorasick is unavailable or there are too few seeds to benefit from it
+        """
+        if ahocorasick is None or len(seed_topics) < AUTOMATON_MIN_SEEDS or not all(seed_topics):
+            return None
+
+        automaton = ahocorasick.Automaton()
+        for idx, seed in enumerate(seed_topics):
+            seed_lower = seed.lower()
+            # Keep the first position so matches resolve like the sequential scan
+            if seed_lower not in automaton:
+                automaton.add_word(seed_lower, (idx, seed))
+        automaton.make_automaton()
+
+        return automaton
+
+    def _find_best_seed_match(self, topic: str, seed_topics: List[str], seed_matcher=None) -> str:
         """Find the seed topic that best matches the given topic.
 
         Args:
             topic: Topic to match
             seed_topics: List of seed topics
+            seed_matcher: Optional automaton built by _build_seed_matcher
 
         Returns:
             Best matching seed topic
@@ -260,6 +265,11 @@ class OpportunityService:
         # Simple word matching for now
         topic_lower = topic.lower()
 
+        if seed_matcher is not None:
+            # Single pass over the topic, preferring the earliest seed like the scan below
+            matches = [value for _, value in seed_matcher.iter(topic_lower)]
+            return min(matches)[1] if matches else seed_topics[0]
+
         for seed in seed_topics:
             seed_lower = seed.lower()
             if seed_lower in topic_lower:
@@ -268,7 +278,8 @@ class OpportunityService:
         # If no match, return the first seed
         return seed_topics[0]
 
-    def _generate_writing_suggestion(self, topic: str, seed: str) -> str:
+    @staticmethod
+    def _generate_writing_suggestion(topic: str, seed: str) -> str:
         """Generate a writing suggestion based on the topic and seed.
 
         Args:
@@ -1,12 +1,12 @@
 """Related service for fetching related topics and queries from Google Trends."""
 
 import logging
-import time
-from typing import Optional
+from typing import Optional, Tuple
 
-import requests
+import pandas as pd
 
-from gtrends_core.config import DEFAULT_CATEGORY, DEFAULT_REGION, DEFAULT_TIMEFRAME
+from gtrends_core.config import DEFAULT_CATEGORY, DEFAULT_TIMEFRAME
+from gtrends_core.context import TrendsContext
 from gtrends_core.exceptions.trends_exceptions import ApiRequestException, NoDataException
 from gtrends_core.models.base import RelatedTopic
 from gtrends_core.models.related import RelatedData, RelatedQueryResults, RelatedTopicResults
@@ -14,33 +14,55 @@ from gtrends_core.utils.helpers import format_region_name
 
 logger = logging.getLogger(__name__)
 
+BREAKOUT_VALUE = 5000.0  # Arbitrary high value for sorting "Breakout" entries
+
+
+def _get_column(df: pd.DataFrame, column: str, default) -> list:
+    """Get a DataFrame column as a list, or a list of defaults if it's missing.
+
+    Args:
+        df: DataFrame to read from
+        column: Column name
+        default: Value used for every row when the column is missing
+
+    Returns:
+        List of column values aligned with the rows
+    """
+    return df[column].tolist() if column in df.columns else [default] * len(df)
+
+
+def _parse_rising_values(df: pd.DataFrame) -> Tuple[list, list]:
+    """Parse the value column of a rising DataFrame in a single vectorized pass.
+
+    Args:
+        df: Rising topics or queries DataFrame
+
+    Returns:
+        Tuple of (numeric values, breakout flags) as lists aligned with the rows
+    """
+    if "value" not in df.columns:
+        return [0.0] * len(df), [False] * len(df)
+
+    values = df["value"]
+    breakout_mask = values.astype("string").str.lower().eq("breakout").fillna(False).astype(bool)
+    numeric_values = pd.to_numeric(values.where(~breakout_mask), errors="coerce").fillna(0.0)
+    numeric_values = numeric_values.mask(breakout_mask, BREAKOUT_VALUE)
+
+    return numeric_values.astype(float).tolist(), breakout_mask.tolist()
+
 
 class RelatedService:
     """Service for fetching related topics and queries from Google Trends."""
 
-    def __init__(self, trends_client):
+    def __init__(self, trends_client, context: Optional[TrendsContext] = None):
         """Initialize with a TrendsClient instance.
 
         Args:
             trends_client: Initialized TrendsClient instance
+            context: Shared TrendsContext (a new one is created if not provided)
         """
         self.client = trends_client
-        self._session = requests.Session()
-        self._last_request_time = 0
-
-    def _throttle_requests(self, min_interval: float = 1.0):
-        """Prevent sending too many requests in a short time.
-
-        Args:
-            min_interval: Minimum time between requests in seconds
-        """
-        current_time = time.time()
-        time_since_last = current_time - self._last_request_time
-
-        if time_since_last < min_interval:
-            time.sleep(min_interval - time_since_last)
-
-        self._last_request_time = time.time()
+        self.context = context or TrendsContext(trends_client)
 
     def get_current_region(self) -> str:
         """Determine the user's current region based on IP.
@@ -48,15 +70,7 @@ class RelatedService:
         Returns:
             Two-letter country code
         """
-        try:
-            self._throttle_requests()
-            response = self._session.get("https://ipinfo.io/json", timeout=5)
-            data = response.json()
-            return data.get("country", DEFAULT_REGION)
-        except Exception as e:
-            # Fallback to default region on any error
-            logger.warning(f"Failed to detect region: {str(e)}")
-            return DEFAULT_REGION
+        return self.context.region
 
     def get_related_data(
         self,
@@ -130,7 +144,7 @@ class RelatedService:
                 region = self.get_current_region()
 
             # Get related topics from Google Trends
-            results = self.client.get_related_topics(
+            results = self.context.related_topics(
                 query=query, region=region, timeframe=timeframe, category=category
             )
 
@@ -140,39 +154,32 @@ class RelatedService:
             # Extract top and rising topics
             top_topics = []
             if "top" in results and not results["top"].empty:
-                for _, row in results["top"].iterrows():
-                    top_topics.append(
-                        RelatedTopic(
-                            title=row.get("topic_title", ""),
-                            value=float(row.get("value", 0)),
-                            is_rising=False,
-                        )
+                top_df = results["top"]
+                top_topics = [
+                    RelatedTopic(title=title, type="topic", value=float(value), is_rising=False)
+                    for title, value in zip(
+                        _get_column(top_df, "topic_title", ""), _get_column(top_df, "value", 0)
                     )
+                ]
 
             rising_topics = []
             if "rising" in results and not results["rising"].empty:
-                for _, row in results["rising"].iterrows():
-                    # Handle "Breakout" values
-                    value_text = None
-                    value = 0.0
-
-                    if isinstance(row.get("value"), str) and row.get("value").lower() == "breakout":
-                        value_text = "Breakout"
-                        value = 5000.0  # Arbitrary high value for sorting
-                    else:
-                        try:
-                            value = float(row.get("value", 0))
-                        except (ValueError, TypeError):
-                            value = 0.0
-
-                    rising_topics.append(
-                        RelatedTopic(
-                            title=row.get("topic_title", ""),
-                            value=value,
-                            is_rising=True,
-                            rising_value_text=value_text,
-                        )
+                rising_df = results["rising"]
+                # Handle "Breakout" values
+                values, breakouts = _parse_rising_values(rising_df)
+
+                rising_topics = [
+                    RelatedTopic(
+                        title=title,
+                        type="topic",
+                        value=value,
+                        is_rising=True,
+                        rising_value_text="Breakout" if is_breakout else None,
                     )
+                    for title, value, is_breakout in zip(
+                        _get_column(rising_df, "topic_title", ""), values, breakouts
+                    )
+                ]
 
             region_name = format_region_name(region)
             return RelatedTopicResults(
@@ -228,39 +235,32 @@ class RelatedService:
             # Extract top and rising queries
             top_queries = []
             if "top" in results and not results["top"].empty:
-                for _, row in results["top"].iterrows():
-                    top_queries.append(
-                        RelatedTopic(
-                            title=row.get("query", ""),
-                            value=float(row.get("value", 0)),
-                            is_rising=False,
-                        )
+                top_df = results["top"]
+                top_queries = [
+                    RelatedTopic(title=title, type="query", value=float(value), is_rising=False)
+                    for title, value in zip(
+                        _get_column(top_df, "query", ""), _get_column(top_df, "value", 0)
                     )
+                ]
 
             rising_queries = []
             if "rising" in results and not results["rising"].empty:
-                for _, row in results["rising"].iterrows():
-                    # Handle "Breakout" values
-                    value_text = None
-                    value = 0.0
-
-                    if isinstance(row.get("value"), str) and row.get("value").lower() == "breakout":
-                        value_text = "Breakout"
-                        value = 5000.0  # Arbitrary high value for sorting
-                    else:
-                        try:
-                            value = float(row.get("value", 0))
-                        except (ValueError, TypeError):
-                            value = 0.0
-
-                    rising_queries.append(
-                        RelatedTopic(
-                            title=row.get("query", ""),
-                            value=value,
-                            is_rising=True,
-                            rising_value_text=value_text,
-                        )
+                rising_df = results["rising"]
+                # Handle "Breakout" values
+                values, breakouts = _parse_rising_values(rising_df)
+
+                rising_queries = [
+                    RelatedTopic(
+                        title=title,
+                        type="query",
+                        value=value,
+                        is_rising=True,
+                        rising_value_text="Breakout" if is_breakout else None,
+                    )
+                    for title, value, is_breakout in zip(
+                        _get_column(rising_df, "query", ""), values, breakouts
                     )
+                ]
 
             region_name = format_region_name(region)
             return RelatedQueryResults(
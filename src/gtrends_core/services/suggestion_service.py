@@ -1,44 +1,131 @@
 """Service for retrieving topic suggestions based on Google Trends data."""
 
 import logging
-import time
-from typing import List, Optional
+from types import MappingProxyType
+from typing import Mapping, Optional, Tuple
 
 import pandas as pd
-import requests
 
-from gtrends_core.config import DEFAULT_REGION
+from gtrends_core.context import TrendsContext
 from gtrends_core.utils.validators import validate_category, validate_region_code
 
 logger = logging.getLogger(__name__)
 
 
+# Category-specific seed keywords for content suggestion
+_SEED_KEYWORDS: Mapping[str, Tuple[str, ...]] = MappingProxyType(
+    {
+        "books": ("books", "reading", "literature", "novel", "author"),
+        "news": ("news", "current events", "headlines", "journalism"),
+        "arts": ("art", "gallery", "exhibition", "artist", "creativity"),
+        "fiction": ("fiction", "novel", "story", "fantasy", "science fiction"),
+        "culture": ("culture", "tradition", "heritage", "identity", "customs"),
+    }
+)
+
+# Seeds used for categories without specific seed keywords
+_DEFAULT_SEEDS: Tuple[str, ...] = ("trending", "popular")
+
+# Google Trends category IDs for content categories
+_CATEGORY_IDS: Mapping[str, str] = MappingProxyType(
+    {
+        "books": "22",
+        "news": "16",
+        "arts": "5",
+        "fiction": "22",
+        "culture": "3",
+    }
+)
+
+# Keywords used to check topic relevance to a category
+_CATEGORY_KEYWORDS: Mapping[str, Tuple[str, ...]] = MappingProxyType(
+    {
+        "books": (
+            "book",
+            "read",
+            "author",
+            "novel",
+            "literature",
+            "story",
+            "publish",
+            "fiction",
+            "nonfiction",
+            "writer",
+            "chapter",
+            "page",
+            "library",
+        ),
+        "news": (
+            "news",
+            "report",
+            "journalist",
+            "headline",
+            "article",
+            "media",
+            "press",
+            "coverage",
+            "event",
+            "announcement",
+            "breaking",
+        ),
+        "arts": (
+            "art",
+            "artist",
+            "creative",
+            "gallery",
+            "exhibition",
+            "museum",
+            "painting",
+            "sculpture",
+            "design",
+            "drawing",
+            "photograph",
+        ),
+        "fiction": (
+            "fiction",
+            "novel",
+            "fantasy",
+            "scifi",
+            "story",
+            "plot",
+            "character",
+            "series",
+            "chapter",
+            "book",
+            "author",
+            "genre",
+            "literature",
+        ),
+        "culture": (
+            "culture",
+            "tradition",
+            "heritage",
+            "identity",
+            "history",
+            "society",
+            "community",
+            "social",
+            "custom",
+            "practice",
+            "belief",
+            "ritual",
+        ),
+    }
+)
+
+
 class SuggestionService:
     """Service for generating content suggestions based on Google Trends data."""
 
-    def __init__(self, trends_client):
+    def __init__(self, trends_client, context: Optional[TrendsContext] = None):
         """Initialize with a TrendsClient instance.
 
         Args:
             trends_client: Initialized TrendsClient instance
+            context: Shared TrendsContext (a new one is created if not provided)
         """
         self.client = trends_client
-        self._session = requests.Session()
-        self._last_request_time = 0
-
-    def _throttle_requests(self, min_interval: float = 1.0):
-        """Prevent sending too many requests in a short time.
-
-        Args:
-            min_interval: Minimum time between requests in seconds
-        """
-        current_time = time.time()
-        time_since_last = current_time - self._last_request_time
-
-        if time_since_last < min_interval:
-            time.sleep(min_interval - time_since_last)
-
-        self._last_request_time = time.time()
+        self.context = context or TrendsContext(trends_client)
 
     def get_current_region(self) -> str:
         """Determine the user's current region based on IP.
@@ -46,15 +133,7 @@ class SuggestionService:
         Returns:
             Two-letter country code
         """
-        try:
-            self._throttle_requests()
-            response = self._session.get("https://ipinfo.io/json", timeout=5)
-            data = response.json()
-            return data.get("country", DEFAULT_REGION)
-        except Exception as e:
-            # Fallback to default region on any error
-            logger.warning(f"Failed to detect region: {str(e)}")
-            return DEFAULT_REGION
+        return self.context.region
 
     def get_topic_suggestions(
         self,
@@ -87,16 +166,19 @@ class SuggestionService:
 
         category = validate_category(category)
 
-        # First, try to get trending searches
-        try:
-            trending_df = self.client.get_trending_searches(region=region)
+        # First, try to get trending searches (not needed when a specific keyword is given)
+        use_trending = not keyword
+        trending_df = pd.DataFrame(columns=["title"])
+        if use_trending:
+            try:
+                trending_df = self.context.trending_df(region)
 
-            # If the dataframe is empty or does not have required columns, create a base one
-            if trending_df.empty or "title" not in trending_df.columns:
+                # If the dataframe is empty or does not have required columns, create a base one
+                if trending_df.empty or "title" not in trending_df.columns:
+                    trending_df = pd.DataFrame(columns=["title"])
+            except Exception as e:
+                logger.warning(f"Error getting trending searches: {e}")
                 trending_df = pd.DataFrame(columns=["title"])
-        except Exception as e:
-            logger.warning(f"Error getting trending searches: {e}")
-            trending_df = pd.DataFrame(columns=["title"])
 
         # If keyword is provided, use it as the only seed keyword
         if keyword:
@@ -105,215 +187,112 @@ class SuggestionService:
             # Otherwise, get category-specific seed keywords
             seed_keywords = self._get_seed_keywords(category)
 
-        # Get related topics for each seed keyword
-        topic_data = []
+        # Candidate topics, collected as DataFrames tagged with their source
+        frames = []
 
         for keyword in seed_keywords:
             try:
-                related_topics = self.client.get_related_topics(
-                    query=keyword, region=region, timeframe=timeframe, category=category
+                related_topics = self.context.related_topics(
+                    keyword, region=region, timeframe=timeframe, category=category
                 )
 
-                # Process rising topics
-                if "rising" in related_topics and not related_topics["rising"].empty:
-                    rising_df = related_topics["rising"]
-
-                    if "topic_title" in rising_df.columns:
-                        for _, row in rising_df.iterrows():
-                            title = row["topic_title"]
-                            value = row["value"]
-
-                            # Skip if this topic is already in our list
-                            if any(t["topic"] == title for t in topic_data):
-                                continue
-
-                            topic_data.append(
-                                {
-                                    "topic": title,
-                                    "relevance_score": value,
-                                    "source": f"Related to '{keyword}'",
-                                    "category": category,
-                                    "rising": True,
-                                }
-                            )
-
-                # Process top topics
-                if "top" in related_topics and not related_topics["top"].empty:
-                    top_df = related_topics["top"]
-
-                    if "topic_title" in top_df.columns:
-                        for _, row in top_df.iterrows():
-                            title = row["topic_title"]
-                            value = row["value"]
-
-                            # Skip if this topic is already in our list
-                            if any(t["topic"] == title for t in topic_data):
-                                continue
-
-                            topic_data.append(
-                                {
-                                    "topic": title,
-                                    "relevance_score": value,
-                                    "source": f"Related to '{keyword}'",
-                                    "category": category,
-                                    "rising": False,
-                                }
-                            )
+                # Process rising topics, then top topics
+                for kind, rising in (("rising", True), ("top", False)):
+                    df = related_topics.get(kind)
+                    if df is None or df.empty or "topic_title" not in df.columns:
+                        continue
+
+                    df = df[["topic_title", "value"]].rename(
+                        columns={"topic_title": "topic", "value": "relevance_score"}
+                    )
+                    df["source"] = f"Related to '{keyword}'"
+                    df["rising"] = rising
+                    frames.append(df)
             except Exception as e:
                 logger.warning(f"Error getting related topics for {keyword}: {e}")
 
         # Add trending searches that might be relevant
-        if not trending_df.empty and "title" in trending_df.columns:
-            for _, row in trending_df.iterrows():
-                title = row["title"]
-
-                # Skip if this topic is already in our list
-                if any(t["topic"] == title for t in topic_data):
-                    continue
-
-                # Check relevance to category
-                relevance = self._check_topic_relevance(title, category)
-
-                if relevance > 30:  # Only include if somewhat relevant
-                    topic_data.append(
+        if use_trending and not trending_df.empty and "title" in trending_df.columns:
+            # Check relevance of all trending titles to the category at once
+            relevance = self._check_topics_relevance(trending_df["title"], category)
+            relevant = relevance > 30  # Only include if somewhat relevant
+
+            if relevant.any():
+                frames.append(
+                    pd.DataFrame(
                         {
-                            "topic": title,
-                            "relevance_score": relevance,
+                            "topic": trending_df["title"][relevant].to_numpy(),
+                            "relevance_score": relevance[relevant].to_numpy(),
                             "source": "Trending searches",
-                            "category": category,
                             "rising": True,
                         }
                     )
+                )
 
         # Create DataFrame and sort by relevance
-        if topic_data:
-            suggestions_df = pd.DataFrame(topic_data)
-            suggestions_df = suggestions_df.sort_values(
-                by=["rising", "relevance_score"], ascending=[False, False]
-            ).reset_index(drop=True)
+        if frames:
+            # Keep the first occurrence of each topic (related topics before trending ones)
+            suggestions_df = pd.concat(frames, ignore_index=True).drop_duplicates(
+                subset=["topic"], keep="first"
+            )
+            suggestions_df["category"] = category
+            suggestions_df = (
+                suggestions_df[["topic", "relevance_score", "source", "category", "rising"]]
+                .sort_values(by=["rising", "relevance_score"], ascending=[False, False])
+                .reset_index(drop=True)
+            )
 
             return suggestions_df.head(count)
 
         # Return empty DataFrame if no results
         return pd.DataFrame(columns=["topic", "relevance_score", "source", "category", "rising"])
 
-    def _get_seed_keywords(self, category: str) -> List[str]:
+    def _get_seed_keywords(self, category: str) -> Tuple[str, ...]:
         """Get category-specific seed keywords for content suggestion.
 
         Args:
             category: Content category
 
         Returns:
-            List of seed keywords
+            Tuple of seed keywords
         """
-        seed_map = {
-            "books": ["books", "reading", "literature", "novel", "author"],
-            "news": ["news", "current events", "headlines", "journalism"],
-            "arts": ["art", "gallery", "exhibition", "artist", "creativity"],
-            "fiction": ["fiction", "novel", "story", "fantasy", "science fiction"],
-            "culture": ["culture", "tradition", "heritage", "identity", "customs"],
-        }
+        return _SEED_KEYWORDS.get(category.lower(), _DEFAULT_SEEDS)
 
-        return seed_map.get(category.lower(), ["trending", "popular"])
+    def _get_category_keywords(self, category: str) -> Tuple[str, ...]:
+        """Get the keywords used to check topic relevance to a category.
 
-    def _check_topic_relevance(self, topic: str, category: str) -> float:
-        """Check the relevance of a topic to a specific category.
+        Args:
+            category: Content category
+
+        Returns:
+            Tuple of keywords (empty for unknown categories)
+        """
+        return _CATEGORY_KEYWORDS.get(category.lower(), ())
+
+    def _check_topics_relevance(self, topics: pd.Series, category: str) -> pd.Series:
+        """Check the relevance of many topics to a specific category at once.
 
         Args:
-            topic: Topic to check
+            topics: Topics to check
             category: Category to check against
 
         Returns:
-            Relevance score (0-100)
+            Series of relevance scores (0-100), aligned with topics
         """
-        # Simple keyword matching for relevance
-        category_keywords = {
-            "books": [
-                "book",
-                "read",
-                "author",
-                "novel",
-                "literature",
-                "story",
-                "publish",
-                "fiction",
-                "nonfiction",
-                "writer",
-                "chapter",
-                "page",
-                "library",
-            ],
-            "news": [
-                "news",
-                "report",
-                "journalist",
-                "headline",
-                "article",
-                "media",
-                "press",
-                "coverage",
-                "event",
-                "announcement",
-                "breaking",
-            ],
-            "arts": [
-                "art",
-                "artist",
-                "creative",
-                "gallery",
-                "exhibition",
-                "museum",
-                "painting",
-                "sculpture",
-                "design",
-                "drawing",
-                "photograph",
-            ],
-            "fiction": [
-                "fiction",
-                "novel",
-                "fantasy",
-                "scifi",
-                "story",
-                "plot",
-                "character",
-                "series",
-                "chapter",
-                "book",
-                "author",
-                "genre",
-                "literature",
-            ],
-            "culture": [
-                "culture",
-                "tradition",
-                "heritage",
-                "identity",
-                "history",
-                "society",
-                "community",
-                "social",
-                "custom",
-                "practice",
-                "belief",
-                "ritual",
-            ],
-        }
-
-        # Get keywords for this category
-        keywords = category_keywords.get(category.lower(), [])
+        keywords = self._get_category_keywords(category)
         if not keywords:
-            return 0
-
-        # Check how many keywords match
-        topic_lower = topic.lower()
-        matches = sum(1 for kw in keywords if kw in topic_lower)
+            return pd.Series(0, index=topics.index)
 
-        # Calculate relevance score
-        if matches > 0:
-            return min(100, matches * 25)  # Scale up to 100
+        # Count keyword matches per topic with vectorized substring checks, stopping
+        # once every topic has the 4 matches that already cap the score at 100
+        topics_lower = topics.astype(str).str.lower()
+        matches = pd.Series(0, index=topics.index)
+        for kw in keywords:
+            matches += topics_lower.str.contains(kw, regex=False)
+            if (matches >= 4).all():
+                break
 
-        return 0
+        return (matches * 25).clip(upper=100)  # Scale up to 100
 
     def _get_category_id(self, category: str) -> str:
         """Get the category ID for a given category name.
@@ -324,13 +303,4 @@ class SuggestionService:
         Returns:
             Category ID as string
         """
-        # This function assumes you have a mapping in config
-        # This should be imported from the appropriate config module
-        content_categories = {
-            "books": "22",
-            "news": "16",
-            "arts": "5",
-            "fiction": "22",
-            "culture": "3",
-        }
-        return content_categories.get(category.lower(), "0")
+        return _CATEGORY_IDS.get(category.lower(), "0")
@@ -1,13 +1,12 @@
 """Trending service for fetching trending search data from Google Trends."""
 
 import logging
-import time
+from dataclasses import replace
 from typing import List, Optional, Union
 
 import pandas as pd
-import requests
 
-from gtrends_core.config import DEFAULT_REGION
+from gtrends_core.context import TrendsContext
 from gtrends_core.exceptions.trends_exceptions import ApiRequestException, NoDataException
 from gtrends_core.models.base import NewsArticle, TrendingTopic
 from gtrends_core.models.trending import TrendingSearchResults
@@ -19,29 +18,15 @@ logger = logging.getLogger(__name__)
 class TrendingService:
     """Service for fetching trending search data from Google Trends."""
 
-    def __init__(self, trends_client):
+    def __init__(self, trends_client, context: Optional[TrendsContext] = None):
         """Initialize with a TrendsClient instance.
 
         Args:
             trends_client: Initialized TrendsClient instance
+            context: Shared TrendsContext (a new one is created if not provided)
         """
         self.client = trends_client
-        self._session = requests.Session()
-        self._last_request_time = 0
-
-    def _throttle_requests(self, min_interval: float = 1.0):
-        """Prevent sending too many requests in a short time.
-
-        Args:
-            min_interval: Minimum time between requests in seconds
-        """
-        current_time = time.time()
-        time_since_last = current_time - self._last_request_time
-
-        if time_since_last < min_interval:
-            time.sleep(min_interval - time_since_last)
-
-        self._last_request_time = time.time()
+        self.context = context or TrendsContext(trends_client)
 
     def get_current_region(self) -> str:
         """Determine the user's current region based on IP.
@@ -49,15 +34,7 @@ class TrendingService:
         Returns:
             Two-letter country code
         """
-        try:
-            self._throttle_requests()
-            response = self._session.get("https://ipinfo.io/json", timeout=5)
-            data = response.json()
-            return data.get("country", DEFAULT_REGION)
-        except Exception as e:
-            # Fallback to default region on any error
-            logger.warning(f"Failed to detect region: {str(e)}")
-            return DEFAULT_REGION
+        return self.context.region
 
     def _convert_trending_results(
         self, trends_data: Union[List, pd.DataFrame]
@@ -74,29 +51,48 @@ class TrendingService:
 
         # If it's a DataFrame, convert it to our model
         if isinstance(trends_data, pd.DataFrame):
-            for i, row in trends_data.iterrows():
+            n = len(trends_data)
+            columns = trends_data.columns
+
+            # Extract every column once instead of inspecting each row
+            titles = trends_data["title"].tolist()
+            ranks = trends_data["rank"].tolist() if "rank" in columns else range(1, n + 1)
+
+            if "volume" in columns:
+                volumes = trends_data["volume"].tolist()
+            elif "traffic" in columns:
+                # Parse traffic strings like "10,000+" in one vectorized pass
+                traffic = pd.to_numeric(
+                    trends_data["traffic"].astype(str).str.replace(r"[+,]", "", regex=True),
+                    errors="coerce",
+                )
+                volumes = [int(v) if pd.notna(v) else None for v in traffic.tolist()]
+            else:
+                volumes = [None] * n
+
+            optional = {
+                name: trends_data[name].tolist() if name in columns else [None] * n
+                for name in ("volume_growth_pct", "geo")
+            }
+            lists = {
+                name: trends_data[name].tolist() if name in columns else [[] for _ in range(n)]
+                for name in ("trend_keywords", "topics", "news_tokens")
+            }
+
+            for i in range(n):
                 # Create a new TrendingTopic with the available data
-                topic = TrendingTopic(
-                    keyword=row["title"],
-                    rank=row.get("rank", i + 1),
-                    volume=(
-                        row.get("volume")
-                        if "volume" in row
-                        else (
-                            int(row["traffic"].replace("+", "").replace(",", ""))
-                            if isinstance(row.get("traffic"), str)
-                            and row.get("traffic")
-                            and any(c.isdigit() for c in row.get("traffic", ""))
-                            else None
-                        )
-                    ),
-                    volume_growth_pct=row.get("volume_growth_pct"),
-                    geo=row.get("geo"),
-                    trend_keywords=row.get("trend_keywords", []),
-                    topics=row.get("topics", []),
-                    news_tokens=row.get("news_tokens", []),
+                topics.append(
+                    TrendingTopic(
+                        keyword=titles[i],
+                        rank=ranks[i],
+                        volume=volumes[i],
+                        volume_growth_pct=optional["volume_growth_pct"][i],
+                        geo=optional["geo"][i],
+                        trend_keywords=lists["trend_keywords"][i],
+                        topics=lists["topics"][i],
+                        news_tokens=lists["news_tokens"][i],
+                    )
                 )
-                topics.append(topic)
 
         # If it's a list of objects, check if they look like TrendKeyword instances
         elif isinstance(trends_data, list) and trends_data:
@@ -213,10 +209,13 @@ class TrendingService:
             if region is None:
                 region = self.get_current_region()
 
+            # News articles from the legacy format, keyed by trending keyword
+            fallback_news = {}
+
             # Try to get trending searches with news using the newer format first
             try:
-                # This will use trending_now_by_rss which includes news articles
-                trending_data = self.client.trends.trending_now_by_rss(geo=region)
+                # The RSS feed includes news articles, errors fall through to the legacy method
+                trending_data = self.client.fetch_trending_rss(region)
                 topics = self._convert_trending_results(trending_data[:limit])
             except (AttributeError, Exception) as e:
                 # Fall back to the older format if the newer one fails
@@ -225,55 +224,34 @@ class TrendingService:
                     region=region, limit=limit
                 )
                 topics = self._convert_trending_results(trending_df.head(limit))
-
-                # For backward compatibility, add news articles to results
-                news_articles = {}
-                for keyword, articles in news_articles_dict.items():
-                    news_article_models = []
-                    for article_dict in articles:
-                        news_article_models.append(
-                            NewsArticle(
-                                title=article_dict["title"],
-                                source=article_dict["source"],
-                                url=article_dict["url"],
-                                time=article_dict.get("time"),
-                                picture=article_dict.get("picture"),
-                                snippet=article_dict.get("snippet"),
-                            )
-                        )
-                    news_articles[keyword] = news_article_models
-
-                # Check if any topics need news articles from the dictionary
-                for topic in topics:
-                    if topic.keyword in news_articles and not topic.news:
-                        # Create a new topic with the news articles (since TrendingTopic is frozen)
-                        new_topic = TrendingTopic(
-                            keyword=topic.keyword,
-                            rank=topic.rank,
-                            volume=topic.volume,
-                            volume_growth_pct=topic.volume_growth_pct,
-                            geo=topic.geo,
-                            started_timestamp=topic.started_timestamp,
-                            ended_timestamp=topic.ended_timestamp,
-                            trend_keywords=topic.trend_keywords,
-                            topics=topic.topics,
-                            news_tokens=topic.news_tokens,
-                            normalized_keyword=topic.normalized_keyword,
-                            news=news_articles[topic.keyword],
+                fallback_news = {
+                    keyword: [
+                        NewsArticle(
+                            title=article_dict["title"],
+                            source=article_dict["source"],
+                            url=article_dict["url"],
+                            time=article_dict.get("time"),
+                            picture=article_dict.get("picture"),
+                            snippet=article_dict.get("snippet"),
                         )
-                        # Replace the topic in the list
-                        idx = topics.index(topic)
-                        topics[idx] = new_topic
+                        for article_dict in articles
+                    ]
+                    for keyword, articles in news_articles_dict.items()
+                }
 
             if not topics:
                 raise NoDataException(f"No trending data available for region {region}")
 
             region_name = format_region_name(region)
 
-            # Prepare news_articles dictionary for backward compatibility
+            # Attach legacy news to topics missing it and, in the same pass, prepare the
+            # news_articles dictionary for backward compatibility
             news_articles = {}
-            for topic in topics:
-                if hasattr(topic, "news") and topic.news:
+            for idx, topic in enumerate(topics):
+                if not topic.news and topic.keyword in fallback_news:
+                    # TrendingTopic is frozen, so replace it with a copy carrying the news
+                    topic = topics[idx] = replace(topic, news=fallback_news[topic.keyword])
+                if topic.news:
                     news_articles[topic.keyword] = topic.news
 
             return TrendingSearchResults(
@@ -1,13 +1,212 @@
 """Formatter utilities for Google Trends data."""
 
+import csv
 import json
-from datetime import datetime
+import math
+import numbers
+import operator
+import os
+from datetime import date, datetime
+from datetime import time as dt_time
+from datetime import timedelta
 from pathlib import Path
 from typing import Any, Dict, List, Union
 
 import pandas as pd
 
 from gtrends_core.exceptions.trends_exceptions import ExportException
+from gtrends_core.models.base import TrendingTopic
+from gtrends_core.models.trending import TrendList
+
+try:
+    import orjson
+except ImportError:  # Optional dependency
+    orjson = None
+
+try:
+    import xlsxwriter
+except ImportError:  # Optional dependency
+    xlsxwriter = None
+
+DEFAULT_SHEET_NAME = "Sheet1"
+CSV_WRITE_BUFFER_SIZE = 1 << 20
+
+# Fetches every exported news article field in a single call
+_ARTICLE_ATTRS = operator.attrgetter("title", "source", "url", "time", "picture", "snippet")
+
+
+class _SafeCharTable(dict):
+    """str.translate table keeping alphanumeric characters and mapping others to "_".
+
+    ASCII characters are precomputed, other code points are resolved on first use.
+    """
+
+    def __missing__(self, code_point: int) -> str:
+        char = chr(code_point)
+        self[code_point] = safe_char = char if char.isalnum() else "_"
+        return safe_char
+
+
+_SAFE_TABLE = _SafeCharTable({i: chr(i) if chr(i).isalnum() else "_" for i in range(128)})
+
+
+def _is_missing(value: Any) -> bool:
+    """Check whether a cell value should be written as an empty cell."""
+    return (
+        value is None
+        or value is pd.NaT
+        or value is pd.NA
+        or (isinstance(value, float) and math.isnan(value))
+    )
+
+
+def _to_xlsx_value(value: Any) -> Any:
+    """Convert a cell value to a type xlsxwriter can write.
+
+    Like DataFrame.to_excel, values that are not numbers, booleans, strings, dates or
+    times (e.g. lists and tuples) are written as their string representation.
+    """
+    if _is_missing(value):
+        return None
+    if isinstance(value, (str, bool, date, dt_time, timedelta)):
+        return value
+    if isinstance(value, numbers.Number):
+        return value.item() if hasattr(value, "item") else value  # numpy scalars
+    return str(value)
+
+
+def _write_xlsx(sheets: Dict[str, pd.DataFrame], file_path: Path) -> None:
+    """Write DataFrames to an Excel workbook, one worksheet per entry.
+
+    Values are written row by row with xlsxwriter when it is installed, skipping
+    pandas' per-cell styling since exports carry no formatting.
+
+    Args:
+        sheets: Mapping of sheet name to DataFrame
+        file_path: Path to save the workbook
+    """
+    if xlsxwriter is None:
+        with pd.ExcelWriter(file_path) as writer:
+            for sheet_name, df in sheets.items():
+                df.to_excel(writer, sheet_name=sheet_name, index=False)
+        return
+
+    workbook = xlsxwriter.Workbook(
+        str(file_path),
+        {
+            "constant_memory": True,
+            "default_date_format": "yyyy-mm-dd hh:mm:ss",
+            "remove_timezone": True,
+        },
+    )
+    try:
+        for sheet_name, df in sheets.items():
+            worksheet = workbook.add_worksheet(sheet_name)
+            worksheet.write_row(0, 0, [str(column) for column in df.columns])
+            for row_idx, row in enumerate(df.itertuples(index=False, name=None), 1):
+                worksheet.write_row(row_idx, 0, [_to_xlsx_value(value) for value in row])
+    finally:
+        workbook.close()
+
+
+def _finite_or_none(value: Any) -> Any:
+    """Replace NaN and infinite floats with None, the way orjson writes them."""
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    return value
+
+
+def _nan_to_none(payload: Any) -> Any:
+    """Recursively replace NaN and infinite floats in a payload with None.
+
+    The stdlib encoder writes them as the non-standard NaN and Infinity tokens
+    without calling default, so they are replaced before encoding.
+    """
+    if isinstance(payload, dict):
+        return {key: _nan_to_none(value) for key, value in payload.items()}
+    if isinstance(payload, (list, tuple)):
+        return [_nan_to_none(value) for value in payload]
+    return _finite_or_none(payload)
+
+
+def _json_default(value: Any) -> Any:
+    """Serialize values the stdlib json encoder doesn't handle natively."""
+    if _is_missing(value):  # pd.NaT and pd.NA
+        return None
+    if isinstance(value, date):
+        return value.isoformat()
+    if hasattr(value, "item"):  # numpy scalars
+        return _finite_or_none(value.item())
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _write_json(payload: Any, file_path: Path) -> None:
+    """Write a JSON-serializable payload to a file, indented by two spaces.
+
+    Uses orjson when it is installed, falling back to the stdlib encoder. Both share
+    _json_default for values they don't handle natively (e.g. pandas Timestamps), write
+    dates and datetimes in ISO 8601 format, and write missing values (None, NaN, NaT,
+    infinities) as null, so the output doesn't depend on which encoder is installed.
+
+    Args:
+        payload: Data to serialize
+        file_path: Path to save the file
+    """
+    if orjson is not None:
+        with open(file_path, "wb") as f:
+            f.write(
+                orjson.dumps(
+                    payload,
+                    option=orjson.OPT_INDENT_2
+                    | orjson.OPT_SERIALIZE_NUMPY
+                    | orjson.OPT_NON_STR_KEYS,
+                    default=_json_default,
+                )
+            )
+        return
+
+    with open(file_path, "w", encoding="utf-8") as f:
+        json.dump(_nan_to_none(payload), f, ensure_ascii=False, indent=2, default=_json_default)
+
+
+def _format_datetime_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """Format datetime and timedelta columns as strings the way DataFrame.to_csv does.
+
+    Datetime columns whose times are all midnight are written as dates only.
+
+    Args:
+        df: DataFrame to format
+
+    Returns:
+        Shallow copy of the DataFrame with formatted columns (or the DataFrame itself
+        when it has none)
+    """
+    positions = [i for i, dtype in enumerate(df.dtypes) if dtype.kind in "mM"]
+    if not positions:
+        return df
+
+    df = df.copy(deep=False)
+    for i in positions:
+        column = df.iloc[:, i]
+        df.isetitem(i, column.astype(str).where(column.notna(), None))
+    return df
+
+
+def _write_csv(df: pd.DataFrame, file_path: Path) -> None:
+    """Write a DataFrame to a CSV file, streaming rows through csv.writer.
+
+    Args:
+        df: DataFrame to write
+        file_path: Path to save the file
+    """
+    df = _format_datetime_columns(df)
+    with open(file_path, "w", newline="", encoding="utf-8", buffering=CSV_WRITE_BUFFER_SIZE) as f:
+        writer = csv.writer(f, lineterminator=os.linesep)
+        writer.writerow(df.columns)
+        writer.writerows(
+            [None if _is_missing(value) else value for value in row]
+            for row in df.itertuples(index=False, name=None)
+        )
 
 
 def pandas_to_records(df: pd.DataFrame) -> List[Dict[str, Any]]:
@@ -38,19 +237,20 @@ def trend_to_dict(trend) -> Dict[str, Any]:
 
     # Convert news articles to dictionaries
     if "news" in result and result["news"]:
-        result["news"] = [
-            {
-                "title": article.title,
-                "source": article.source,
-                "url": article.url,
-                "time": (
-                    article.time.isoformat() if hasattr(article.time, "isoformat") else article.time
-                ),
-                "picture": article.picture,
-                "snippet": article.snippet,
-            }
-            for article in result["news"]
-        ]
+        news = []
+        for article in result["news"]:
+            title, source, url, time, picture, snippet = _ARTICLE_ATTRS(article)
+            news.append(
+                {
+                    "title": title,
+                    "source": source,
+                    "url": url,
+                    "time": time,
+                    "picture": picture,
+                    "snippet": snippet,
+                }
+            )
+        result["news"] = news
 
     # Convert timestamps if needed
     for ts_field in ["started_timestamp", "ended_timestamp"]:
@@ -72,6 +272,20 @@ def trend_list_to_dicts(trend_list) -> List[Dict[str, Any]]:
     return [trend_to_dict(trend) for trend in trend_list]
 
 
+def _join_list_column(series: pd.Series) -> pd.Series:
+    """Join each list in a Series into a comma-separated string.
+
+    Args:
+        series: Series whose values are lists (or missing)
+
+    Returns:
+        Series of strings, empty for empty lists and missing where the input is missing
+    """
+    items = series.explode().dropna().astype(str)
+    joined = items.groupby(level=0, sort=False).agg(", ".join)
+    return joined.reindex(series.index, fill_value="").where(series.notna())
+
+
 def trend_list_to_dataframe(trend_list) -> pd.DataFrame:
     """Convert a TrendList object to a pandas DataFrame.
 
@@ -81,34 +295,55 @@ def trend_list_to_dataframe(trend_list) -> pd.DataFrame:
     Returns:
         DataFrame representation of the trend list
     """
-    # Convert trends to dictionaries, flattening the structure
-    flat_trends = []
-    for trend in trend_list:
-        trend_dict = trend_to_dict(trend)
+    # Build the columns in a single pass, flattening the structure without
+    # materializing intermediate per-trend and per-article dictionaries
+    columns: Dict[str, list] = {}
+    n_rows = 0
+
+    for row, trend in enumerate(trend_list):
+        values = {k: v for k, v in trend.__dict__.items() if not k.startswith("_")}
 
         # Handle news separately to avoid nesting
-        news = trend_dict.pop("news", [])
-        news_count = len(news)
+        news = values.pop("news", None) or []
+
+        # Convert timestamps if needed
+        for ts_field in ["started_timestamp", "ended_timestamp"]:
+            if values.get(ts_field) and isinstance(values[ts_field], tuple):
+                values[f"{ts_field}_str"] = datetime.fromtimestamp(values[ts_field][0]).isoformat()
 
         # Flatten news titles and sources into comma-separated strings
-        if news_count > 0:
-            trend_dict["news_titles"] = ", ".join([n["title"] for n in news])
-            trend_dict["news_sources"] = ", ".join([n["source"] for n in news])
+        if news:
+            values["news_titles"] = ", ".join(article.title for article in news)
+            values["news_sources"] = ", ".join(article.source for article in news)
 
-        trend_dict["news_count"] = news_count
+        values["news_count"] = len(news)
 
-        # Convert lists to comma-separated strings
-        for k, v in trend_dict.items():
-            if isinstance(v, list):
-                trend_dict[k] = ", ".join([str(item) for item in v])
+        for key, value in values.items():
+            column = columns.get(key)
+            if column is None:
+                # Column first seen on this row, earlier rows have no value
+                column = columns[key] = [None] * row
+            column.append(value)
 
-        flat_trends.append(trend_dict)
+        n_rows = row + 1
 
     # Create DataFrame
-    if not flat_trends:
+    if not n_rows:
         return pd.DataFrame()
 
-    return pd.DataFrame(flat_trends)
+    # Pad columns that were missing from the last rows
+    for column in columns.values():
+        column.extend([None] * (n_rows - len(column)))
+
+    df = pd.DataFrame(columns)
+
+    # Convert list columns to comma-separated strings, a whole column at a time
+    for col in df.columns:
+        first_valid = df[col].first_valid_index()
+        if first_valid is not None and isinstance(df[col].at[first_valid], list):
+            df[col] = _join_list_column(df[col])
+
+    return df
 
 
 def export_to_file(
@@ -132,17 +367,19 @@ def export_to_file(
     file_path = Path(file_path)
 
     try:
-        # Handle TrendList objects
-        if hasattr(data, "__class__") and data.__class__.__name__ == "TrendList":
+        # Handle TrendList objects and plain lists of TrendingTopic objects, both
+        # are exported directly without wrapping or copying the list
+        if isinstance(data, TrendList) or (
+            isinstance(data, list) and len(data) > 0 and isinstance(data[0], TrendingTopic)
+        ):
             if format.lower() == "json":
-                with open(file_path, "w", encoding="utf-8") as f:
-                    json.dump(trend_list_to_dicts(data), f, ensure_ascii=False, indent=2)
+                _write_json(trend_list_to_dicts(data), file_path)
             elif format.lower() in ["csv", "xlsx"]:
                 df = trend_list_to_dataframe(data)
                 if format.lower() == "csv":
-                    df.to_csv(file_path, index=False)
+                    _write_csv(df, file_path)
                 else:  # xlsx
-                    df.to_excel(file_path, index=False)
+                    _write_xlsx({DEFAULT_SHEET_NAME: df}, file_path)
             else:
                 raise ExportException(
                     f"Unsupported export format for TrendList: {format}",
@@ -154,11 +391,11 @@ def export_to_file(
         # Handle DataFrame
         elif isinstance(data, pd.DataFrame):
             if format.lower() == "csv":
-                data.to_csv(file_path, index=False)
+                _write_csv(data, file_path)
             elif format.lower() == "json":
                 data.to_json(file_path, orient="records", date_format="iso")
             elif format.lower() == "xlsx":
-                data.to_excel(file_path, index=False)
+                _write_xlsx({DEFAULT_SHEET_NAME: data}, file_path)
             else:
                 raise ExportException(
                     f"Unsupported export format: {format}", file_path=str(file_path), format=format
@@ -169,60 +406,49 @@ def export_to_file(
             # For dictionaries of DataFrames, save multiple sheets in Excel
             # or create multiple files for CSV and JSON
             if format.lower() == "xlsx":
-                with pd.ExcelWriter(file_path) as writer:
-                    for sheet_name, df in data.items():
-                        if not isinstance(df, pd.DataFrame):
-                            continue
-                        sheet_name = str(sheet_name)[:31]  # Excel limits sheet names to 31 chars
-                        df.to_excel(writer, sheet_name=sheet_name, index=False)
+                _write_xlsx(
+                    {
+                        str(sheet_name)[:31]: df  # Excel limits sheet names to 31 chars
+                        for sheet_name, df in data.items()
+                        if isinstance(df, pd.DataFrame)
+                    },
+                    file_path,
+                )
             else:
                 # Create a directory based on the file name
                 dir_name = file_path.stem
                 dir_path = file_path.parent / dir_name
-                dir_path.mkdir(exist_ok=True)
+                dir_path.mkdir(parents=True, exist_ok=True)
 
                 # Save each DataFrame to a separate file
                 for key, df in data.items():
                     if not isinstance(df, pd.DataFrame):
                         continue
 
-                    safe_key = "".join(c if c.isalnum() else "_" for c in str(key))
+                    safe_key = str(key).translate(_SAFE_TABLE)
                     file_name = f"{safe_key}.{format.lower()}"
                     sub_path = dir_path / file_name
 
                     if format.lower() == "csv":
-                        df.to_csv(sub_path, index=False)
+                        _write_csv(df, sub_path)
                     elif format.lower() == "json":
                         df.to_json(sub_path, orient="records", date_format="iso")
 
                 # Return the directory path
                 return str(dir_path)
 
-        # Handle lists that might contain TrendingTopic objects
-        elif (
-            isinstance(data, list)
-            and len(data) > 0
-            and hasattr(data[0], "__class__")
-            and data[0].__class__.__name__ == "TrendingTopic"
-        ):
-            # Convert the list to a TrendList first
-            from gtrends_core.models.trending import TrendList
-
-            return export_to_file(TrendList(data), file_path, format)
-
         # Handle other list types
         elif isinstance(data, list):
             if format.lower() == "json":
-                with open(file_path, "w", encoding="utf-8") as f:
-                    json.dump(data, f, ensure_ascii=False, indent=2)
+                _write_json(data, file_path)
             elif format.lower() in ["csv", "xlsx"]:
                 # Try to convert list to DataFrame
                 try:
                     df = pd.DataFrame(data)
                     if format.lower() == "csv":
-                        df.to_csv(file_path, index=False)
+                        _write_csv(df, file_path)
                     else:  # xlsx
-                        df.to_excel(file_path, index=False)
+                        _write_xlsx({DEFAULT_SHEET_NAME: df}, file_path)
                 except Exception as e:
                     raise ExportException(
                         f"Could not convert list to DataFrame: {str(e)}",
@@ -1,12 +1,60 @@
 """Common helper functions for Google Trends functionality."""
 
 import logging
-from datetime import datetime
-from typing import Dict, List, Union
+import time
+from types import MappingProxyType
+from typing import List, Mapping, Union
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Readable names for region codes (simplified, in a real implementation
+# we would use a full country code mapping)
+_REGION_NAMES: Mapping[str, str] = MappingProxyType(
+    {
+        "US": "United States",
+        "GB": "United Kingdom",
+        "CA": "Canada",
+        "AU": "Australia",
+        "IN": "India",
+        "DE": "Germany",
+        "FR": "France",
+        "JP": "Japan",
+        "BR": "Brazil",
+        "RU": "Russia",
+        "MX": "Mexico",
+        "ES": "Spain",
+        "IT": "Italy",
+        "CN": "China",
+        "AE": "United Arab Emirates",
+    }
+)
+
+# Google Trends topic IDs and their names
+_TOPIC_IDS: Mapping[int, str] = MappingProxyType(
+    {
+        1: "Autos and Vehicles",
+        2: "Beauty and Fashion",
+        3: "Business and Finance",
+        20: "Climate",
+        4: "Entertainment",
+        5: "Food and Drink",
+        6: "Games",
+        7: "Health",
+        8: "Hobbies and Leisure",
+        9: "Jobs and Education",
+        10: "Law and Government",
+        11: "Other",
+        13: "Pets and Animals",
+        14: "Politics",
+        15: "Science",
+        16: "Shopping",
+        17: "Sports",
+        18: "Technology",
+        19: "Travel and Transportation",
+    }
+)
+
 
 def ensure_list(value: Union[str, List[str], List[dict]]) -> List:
     """Ensure a value is a list.
@@ -31,26 +79,7 @@ def format_region_name(region_code: str) -> str:
     Returns:
         Formatted region name
     """
-    # This is a simplified version, in a real implementation
-    # we would use a country code mapping
-    region_names = {
-        "US": "United States",
-        "GB": "United Kingdom",
-        "CA": "Canada",
-        "AU": "Australia",
-        "IN": "India",
-        "DE": "Germany",
-        "FR": "France",
-        "JP": "Japan",
-        "BR": "Brazil",
-        "RU": "Russia",
-        "MX": "Mexico",
-        "ES": "Spain",
-        "IT": "Italy",
-        "CN": "China",
-        "AE": "United Arab Emirates",
-    }
-    return region_names.get(region_code, region_code)
+    return _REGION_NAMES.get(region_code, region_code)
 
 
 def get_timestamp_str() -> str:
@@ -59,36 +88,16 @@ def get_timestamp_str() -> str:
     Returns:
         Timestamp string in format 'YYYYMMDD_HHMMSS'
     """
-    return datetime.now().strftime("%Y%m%d_%H%M%S")
+    return time.strftime("%Y%m%d_%H%M%S")
 
 
-def get_topic_id_map() -> Dict[int, str]:
+def get_topic_id_map() -> Mapping[int, str]:
     """Get a mapping of topic IDs to topic names.
 
     Returns:
-        Dictionary mapping topic IDs (integers) to topic names (strings)
+        Read-only mapping of topic IDs (integers) to topic names (strings)
     """
-    return {
-        1: "Autos and Vehicles",
-        2: "Beauty and Fashion",
-        3: "Business and Finance",
-        20: "Climate",
-        4: "Entertainment",
-        5: "Food and Drink",
-        6: "Games",
-        7: "Health",
-        8: "Hobbies and Leisure",
-        9: "Jobs and Education",
-        10: "Law and Government",
-        11: "Other",
-        13: "Pets and Animals",
-        14: "Politics",
-        15: "Science",
-        16: "Shopping",
-        17: "Sports",
-        18: "Technology",
-        19: "Travel and Transportation",
-    }
+    return _TOPIC_IDS
 
 
 def truncate_string(s: str, max_length: int) -> str:
@@ -103,4 +112,4 @@ def truncate_string(s: str, max_length: int) -> str:
     """
     if len(s) <= max_length:
         return s
-    return s[: max_length - 3] + "..."
+    return f"{s[: max_length - 3]}..."
@@ -0,0 +1,151 @@
+"""Conditional HTTP request caching for Google Trends endpoints."""
+
+import json
+import logging
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+# Maximum number of responses kept; the oldest entries are dropped first
+MAX_CACHE_ENTRIES = 32
+
+
+def default_cache_path() -> Path:
+    """Get the default location of the persisted cache (resolved on each call).
+
+    Returns:
+        Path of the JSON cache file in the user's cache directory
+    """
+    return Path.home() / ".cache" / "gtrends" / "http_etag.json"
+
+
+class ConditionalRequestCache:
+    """Cache of ETag/Last-Modified validators and response bodies for GET requests.
+
+    Requests are sent with If-None-Match/If-Modified-Since headers when a previous
+    response is known, and a 304 Not Modified answer is served from the cached body.
+    """
+
+    def __init__(self, cache_path: Optional[Path] = None, max_entries: int = MAX_CACHE_ENTRIES):
+        """Initialize the cache.
+
+        Args:
+            cache_path: JSON file used to persist validators and bodies
+                (or None for the default location in the user's cache directory)
+            max_entries: Maximum number of responses kept
+        """
+        self._cache_path = Path(cache_path) if cache_path is not None else None
+        self.max_entries = max_entries
+        self._entries: Optional[Dict[str, Dict[str, str]]] = None
+        self._lock = threading.Lock()
+
+    @property
+    def cache_path(self) -> Path:
+        """JSON file used to persist validators and bodies."""
+        return self._cache_path or default_cache_path()
+
+    @staticmethod
+    def _make_key(url: str, params: Optional[Dict[str, Any]] = None) -> str:
+        """Build the cache key for a URL and its query parameters."""
+        return json.dumps([url, params or {}], sort_keys=True)
+
+    def _load(self) -> Dict[str, Dict[str, str]]:
+        """Load cached entries from disk on first use."""
+        if self._entries is None:
+            try:
+                with open(self.cache_path, "r", encoding="utf-8") as f:
+                    self._entries = json.load(f)
+            except (OSError, ValueError):
+                self._entries = {}
+        return self._entries
+
+    def _save(self) -> None:
+        """Persist cached entries to disk, ignoring filesystem errors."""
+        cache_path = self.cache_path
+        tmp_name = None
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            # Write to a unique temporary file so concurrent processes never share one
+            with tempfile.NamedTemporaryFile(
+                "w",
+                encoding="utf-8",
+                dir=cache_path.parent,
+                prefix=f"{cache_path.name}.",
+                suffix=".tmp",
+                delete=False,
+            ) as f:
+                tmp_name = f.name
+                json.dump(self._entries, f)
+            os.replace(tmp_name, cache_path)
+        except OSError as e:
+            logger.warning(f"Failed to write HTTP cache {cache_path}: {str(e)}")
+            if tmp_name is not None:
+                try:
+                    os.unlink(tmp_name)
+                except OSError:
+                    pass
+
+    def get(
+        self,
+        session: requests.Session,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+    ) -> str:
+        """Send a conditional GET request and return the response body.
+
+        Args:
+            session: Session used to send the request
+            url: URL to request
+            params: Query parameters
+            timeout: Request timeout in seconds
+
+        Returns:
+            Response body, taken from the cache when the server answers 304
+
+        Raises:
+            requests.HTTPError: If the server answers with an error status
+        """
+        key = self._make_key(url, params)
+
+        with self._lock:
+            entry = self._load().get(key)
+
+        headers = {}
+        if entry:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+
+        response = session.get(url, params=params, headers=headers, timeout=timeout)
+
+        if response.status_code == 304 and entry:
+            logger.debug(f"Not modified, using cached response for {url}")
+            return entry["body"]
+
+        response.raise_for_status()
+
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if etag or last_modified:
+            with self._lock:
+                entries = self._load()
+                # Re-insert so the entry becomes the most recent one
+                entries.pop(key, None)
+                entries[key] = {
+                    "etag": etag or "",
+                    "last_modified": last_modified or "",
+                    "body": response.text,
+                }
+                while len(entries) > self.max_entries:
+                    del entries[next(iter(entries))]
+                self._save()
+
+        return response.text
@@ -0,0 +1,58 @@
+"""Shared HTTP session and IP-based region detection."""
+
+import logging
+import threading
+import time
+from typing import Optional, Tuple
+
+import requests
+
+from gtrends_core.config import DEFAULT_REGION
+from gtrends_core.utils.ratelimit import IPINFO_BUCKET
+
+logger = logging.getLogger(__name__)
+
+IPINFO_URL = "https://ipinfo.io/json"
+REGION_CACHE_TTL = 86400  # 24 hours
+
+# Session shared by all services so connections to auxiliary hosts are reused
+SHARED_SESSION = requests.Session()
+
+_region_cache: Optional[Tuple[str, float]] = None
+_region_lock = threading.Lock()
+
+
+def get_current_region_cached(
+    session: requests.Session = SHARED_SESSION, ttl: float = REGION_CACHE_TTL
+) -> str:
+    """Determine the user's current region based on IP, caching the result.
+
+    Failed lookups are not cached, so the next call tries again.
+
+    Args:
+        session: Session used to query ipinfo.io
+        ttl: Time in seconds a detected region is reused
+
+    Returns:
+        Two-letter country code
+    """
+    global _region_cache
+
+    with _region_lock:
+        if _region_cache is not None and _region_cache[1] > time.monotonic():
+            return _region_cache[0]
+
+        try:
+            IPINFO_BUCKET.acquire()
+            response = session.get(IPINFO_URL, timeout=5)
+            region = response.json().get("country")
+        except Exception as e:
+            # Fallback to default region on any error
+            logger.warning(f"Failed to detect region: {str(e)}")
+            return DEFAULT_REGION
+
+        if not region:
+            return DEFAULT_REGION
+
+        _region_cache = (region, time.monotonic() + ttl)
+        return region
@@ -0,0 +1,59 @@
+"""Process-wide rate limiting for outgoing requests."""
+
+import threading
+import time
+
+
+class TokenBucket:
+    """Token-bucket rate limiter shared across threads and service instances.
+
+    Tokens refill continuously at a fixed rate up to the bucket capacity, so short
+    bursts are served immediately while the long-run request rate stays capped.
+    """
+
+    def __init__(self, rate: float, capacity: int):
+        """Initialize the bucket full.
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum number of tokens (burst size)
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        """Add the tokens accumulated since the last update (lock must be held)."""
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+    def acquire(self, block: bool = True) -> bool:
+        """Take one token from the bucket.
+
+        Args:
+            block: Whether to wait for a token when the bucket is empty
+
+        Returns:
+            True if a token was taken, False if the bucket is empty and block is False
+        """
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return True
+                if not block:
+                    return False
+                wait = (1 - self._tokens) / self.rate
+
+            time.sleep(wait)
+
+
+# Shared limiter for IP geolocation lookups (ipinfo.io)
+IPINFO_BUCKET = TokenBucket(rate=1.0, capacity=3)
+
+# Shared limiter for Google Trends requests, one request per second without bursts
+TRENDS_BUCKET = TokenBucket(rate=1.0, capacity=1)
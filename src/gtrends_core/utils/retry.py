@@ -0,0 +1,118 @@
+"""Retry helpers for rate-limited Google Trends requests."""
+
+import functools
+import logging
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Optional, TypeVar
+
+import requests
+
+from gtrends_core.exceptions.trends_exceptions import RateLimitException
+
+logger = logging.getLogger(__name__)
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+def _get_retry_after(error: requests.HTTPError) -> Optional[float]:
+    """Read the Retry-After header of a 429 response.
+
+    Args:
+        error: HTTP error raised for the response
+
+    Returns:
+        Delay in seconds, or None if the header is missing or invalid
+    """
+    value = error.response.headers.get("Retry-After") if error.response is not None else None
+    if not value:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(tz=timezone.utc)).total_seconds())
+
+
+def is_rate_limited(error: Exception) -> bool:
+    """Check whether an exception was caused by an HTTP 429 response."""
+    return (
+        isinstance(error, requests.HTTPError)
+        and error.response is not None
+        and error.response.status_code == 429
+    )
+
+
+def retry_on_429(max_attempts: int = 4, base: float = 0.5, cap: float = 8.0) -> Callable[[F], F]:
+    """Retry a request on HTTP 429 with exponential backoff and jitter.
+
+    The Retry-After header is honored when present, up to cap seconds. Time already
+    spent in the failed attempt (such as TrendsPy's own pause before it raises the 429)
+    counts toward the delay. Backoff sleeps happen outside any lock, while the retried
+    requests of the same decorated function are serialized so concurrent callers don't
+    retry in lockstep.
+
+    Args:
+        max_attempts: Maximum number of attempts, including the first one
+        base: Base delay in seconds
+        cap: Maximum delay in seconds (before jitter for computed backoff)
+
+    Returns:
+        Decorator wrapping the function with retry logic
+
+    Raises:
+        RateLimitException: If the request is still rate limited after all attempts
+    """
+
+    def decorator(func: F) -> F:
+        retry_lock = threading.Lock()
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            attempt = 0
+            delay = 0.0
+            while True:
+                try:
+                    if attempt == 0:
+                        started = time.monotonic()
+                        return func(*args, **kwargs)
+                    time.sleep(delay)
+                    with retry_lock:
+                        started = time.monotonic()
+                        return func(*args, **kwargs)
+                except requests.HTTPError as e:
+                    if not is_rate_limited(e):
+                        raise
+
+                    retry_after = _get_retry_after(e)
+                    attempt += 1
+                    if attempt >= max_attempts:
+                        raise RateLimitException(
+                            f"Rate limit exceeded after {max_attempts} attempts",
+                            retry_after=int(retry_after) if retry_after is not None else None,
+                        ) from e
+
+                    if retry_after is not None:
+                        delay = min(cap, retry_after)
+                    else:
+                        delay = min(cap, base * 2**attempt) + random.uniform(0, base)
+                    delay = max(0.0, delay - (time.monotonic() - started))
+                    logger.warning(
+                        f"Rate limited calling {func.__name__}, retrying in {delay:.1f}s "
+                        f"(attempt {attempt + 1}/{max_attempts})"
+                    )
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
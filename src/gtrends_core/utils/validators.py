@@ -1,8 +1,9 @@
 """Validation utilities for Google Trends functionality."""
 
+import functools
 import os
 import re
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from pathlib import Path
 from typing import Any, Union
 
@@ -22,6 +23,11 @@ TIMEFRAME_PATTERN = re.compile(
     r"^all$"
 )
 
+# Precompiled patterns used when parsing timeframes
+PERIOD_PATTERN = re.compile(r"^(now|today) (\d+)-([HhdmMy])$", re.IGNORECASE)
+DATE_PATTERN = re.compile(r"^(\d{4}-\d{2}-\d{2})$")
+DATE_RANGE_PATTERN = re.compile(r"^(\d{4}-\d{2}-\d{2}) (\d{4}-\d{2}-\d{2})$")
+
 
 def validate_region_code(region_code: str) -> str:
     """Validate a region code.
@@ -41,7 +47,7 @@ def validate_region_code(region_code: str) -> str:
         raise InvalidParameterException("Region code must be a string", param_name="region_code")
 
     region_code = region_code.upper()
-    if not re.match(r"^[A-Z]{2}$", region_code):
+    if len(region_code) != 2 or not (region_code.isascii() and region_code.isalpha()):
         raise RegionNotFoundException(region_code)
 
     return region_code
@@ -64,29 +70,27 @@ def convert_timeframe(timeframe: str) -> str:
         return "now 1-H"
 
     # Check for period formats like "now 7-d" or "today 12-m"
-    period_match = re.match(r"^(now|today) (\d+)-([HhdmMy])$", timeframe, re.IGNORECASE)
+    period_match = PERIOD_PATTERN.match(timeframe)
     if period_match:
         base, value, unit = period_match.groups()
         unit = unit.lower()
         return f"{base.lower()} {value}-{unit}"
 
     # Check for specific date formats
-    date_match = re.match(r"^(\d{4}-\d{2}-\d{2})$", timeframe)
+    date_match = DATE_PATTERN.match(timeframe)
     if date_match:
         date_str = date_match.group(1)
         try:
             # Validate the date by parsing it
-            datetime.strptime(date_str, "%Y-%m-%d")
+            day = datetime.strptime(date_str, "%Y-%m-%d")
             # Single date means that specific day
-            tomorrow = (datetime.strptime(date_str, "%Y-%m-%d") + timedelta(days=1)).strftime(
-                "%Y-%m-%d"
-            )
+            tomorrow = (day + timedelta(days=1)).strftime("%Y-%m-%d")
             return f"{date_str} {tomorrow}"
         except ValueError:
             raise TimeframeParseException(timeframe)
 
     # Check for date range format like "2020-01-01 2020-12-31"
-    range_match = re.match(r"^(\d{4}-\d{2}-\d{2}) (\d{4}-\d{2}-\d{2})$", timeframe)
+    range_match = DATE_RANGE_PATTERN.match(timeframe)
     if range_match:
         start, end = range_match.groups()
         try:
@@ -128,7 +132,7 @@ def check_timeframe_resolution(timeframe: str) -> str:
             return timeframe
 
         # Process relative timeframes (now X-unit or today X-unit)
-        period_match = re.match(r"^(now|today) (\d+)-([HhdmMy])$", timeframe, re.IGNORECASE)
+        period_match = PERIOD_PATTERN.match(timeframe)
         if period_match:
             _, value, unit = period_match.groups()
             value = int(value)
@@ -149,11 +153,12 @@ def check_timeframe_resolution(timeframe: str) -> str:
             return timeframe
 
         # Process date range timeframes
-        range_match = re.match(r"^(\d{4}-\d{2}-\d{2}) (\d{4}-\d{2}-\d{2})$", timeframe)
+        range_match = DATE_RANGE_PATTERN.match(timeframe)
         if range_match:
             start, end = range_match.groups()
-            start_date = datetime.strptime(start, "%Y-%m-%d")
-            end_date = datetime.strptime(end, "%Y-%m-%d")
+            # Both dates were validated by convert_timeframe, so parse them cheaply
+            start_date = date.fromisoformat(start)
+            end_date = date.fromisoformat(end)
             days_diff = (end_date - start_date).days
 
             # Adjust resolution based on range
@@ -196,6 +201,15 @@ def parse_timeframe(timeframe: str) -> str:
     if not timeframe or not isinstance(timeframe, str):
         raise InvalidParameterException("Timeframe must be a string", param_name="timeframe")
 
+    return _parse_timeframe(timeframe)
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_timeframe(timeframe: str) -> str:
+    """Convert a timeframe string, caching the result per input string.
+
+    Invalid timeframes raise and are not cached.
+    """
     try:
         return convert_timeframe(timeframe)
     except TimeframeParseException:
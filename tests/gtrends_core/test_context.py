@@ -0,0 +1,67 @@
+"""Tests for the shared TrendsContext cache."""
+
+import pandas as pd
+import pytest
+
+from gtrends_core.context import TrendsContext
+
+
+class FakeClient:
+    """Client returning queued trending frames and counting requests."""
+
+    def __init__(self, *frames):
+        self.frames = list(frames)
+        self.trending_calls = 0
+        self.related_calls = 0
+
+    def get_trending_searches(self, region=None):
+        self.trending_calls += 1
+        return self.frames.pop(0)
+
+    def get_related_topics(self, query, region=None, timeframe=None, category=None):
+        self.related_calls += 1
+        return {"top": pd.DataFrame({"topic_title": [f"{query} {region}"]})}
+
+
+def trending_frame(*titles):
+    return pd.DataFrame({"title": list(titles)})
+
+
+def test_trending_df_is_cached_per_region():
+    client = FakeClient(trending_frame("a"), trending_frame("b"))
+    context = TrendsContext(client, region="US")
+
+    assert context.trending_df()["title"].tolist() == ["a"]
+    assert context.trending_df("US")["title"].tolist() == ["a"]
+    assert context.trending_df("GB")["title"].tolist() == ["b"]
+    assert client.trending_calls == 2
+
+
+def test_empty_trending_df_is_not_cached():
+    # TrendsClient.get_trending_searches returns an empty frame when the request fails
+    client = FakeClient(trending_frame(), trending_frame("a"))
+    context = TrendsContext(client, region="US")
+
+    assert context.trending_df().empty
+    assert context.trending_df()["title"].tolist() == ["a"]
+    assert context.trending_df()["title"].tolist() == ["a"]
+    assert client.trending_calls == 2
+
+
+def test_failed_related_topics_fetch_is_not_cached():
+    class FlakyClient(FakeClient):
+        def get_related_topics(self, query, region=None, timeframe=None, category=None):
+            if self.related_calls == 0:
+                self.related_calls += 1
+                raise ConnectionError("temporary failure")
+            return super().get_related_topics(query, region, timeframe, category)
+
+    client = FlakyClient()
+    context = TrendsContext(client, region="US")
+
+    with pytest.raises(ConnectionError):
+        context.related_topics("books")
+
+    assert context.related_topics("books")["top"]["topic_title"].tolist() == ["books US"]
+    assert context.related_topics("books")["top"]["topic_title"].tolist() == ["books US"]
+    assert client.related_calls == 2
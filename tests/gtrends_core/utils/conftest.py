@@ -0,0 +1,23 @@
+"""Shared fixtures for the utility tests."""
+
+import pytest
+
+
+class FakeClock:
+    """Stand-in for the time module, advancing only when asked to."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def fake_clock():
+    return FakeClock()
@@ -0,0 +1,126 @@
+"""Tests for the export formatters."""
+
+import json
+from datetime import date, datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from gtrends_core.models.base import NewsArticle, TrendingTopic
+from gtrends_core.models.trending import TrendList
+from gtrends_core.utils import formatters
+from gtrends_core.utils.formatters import export_to_file
+
+PAYLOAD = [
+    {
+        "title": "café",
+        "volume": 1200,
+        "ratio": 0.25,
+        "missing": float("nan"),
+        "overflow": float("inf"),
+        "numpy_missing": np.float64("nan"),
+        "numpy_count": np.int64(7),
+        "started": pd.Timestamp("2024-05-01 12:30:00"),
+        "ended": pd.NaT,
+        "day": date(2024, 5, 1),
+        "seen": datetime(2024, 5, 1, 8, 0),
+        "tags": ("a", "b"),
+        "empty": None,
+    }
+]
+
+
+def write_json(tmp_path, name, payload=PAYLOAD):
+    file_path = tmp_path / name
+    formatters._write_json(payload, file_path)
+    return file_path.read_bytes()
+
+
+def test_stdlib_json_writes_missing_values_as_null(tmp_path, monkeypatch):
+    monkeypatch.setattr(formatters, "orjson", None)
+
+    record = json.loads(write_json(tmp_path, "stdlib.json"))[0]
+
+    assert record["missing"] is None
+    assert record["overflow"] is None
+    assert record["numpy_missing"] is None
+    assert record["ended"] is None
+    assert record["started"] == "2024-05-01T12:30:00"
+    assert record["numpy_count"] == 7
+
+
+def test_json_output_matches_across_encoders(tmp_path, monkeypatch):
+    pytest.importorskip("orjson")
+    with_orjson = write_json(tmp_path, "orjson.json")
+
+    monkeypatch.setattr(formatters, "orjson", None)
+    with_stdlib = write_json(tmp_path, "stdlib.json")
+
+    assert with_orjson == with_stdlib
+
+
+def sample_frame():
+    return pd.DataFrame(
+        {
+            "title": ["plain", 'with "quotes", commas', "línea\nnueva", None],
+            "volume": [1200, 50, 0, 7],
+            "ratio": [0.1, float("nan"), 1e-7, 2.5],
+            "rising": [True, False, True, False],
+            "day": pd.to_datetime(["2024-05-01", "2024-05-02", None, "2024-05-04"]),
+            "seen": pd.to_datetime(["2024-05-01 08:00:00", None, "2024-05-03 23:59:59", None]),
+        }
+    )
+
+
+def sample_trends():
+    return TrendList(
+        [
+            TrendingTopic(
+                keyword="eclipse",
+                rank=1,
+                volume=500000,
+                volume_growth_pct=1000.0,
+                geo="US",
+                started_timestamp=(1712000000, 0),
+                trend_keywords=["eclipse", "solar eclipse"],
+                topics=[15],
+                news=[NewsArticle(title="Sky", source="Daily", url="https://example.com")],
+            ),
+            TrendingTopic(keyword="café", rank=2),
+        ]
+    )
+
+
+def test_csv_export_matches_pandas(tmp_path):
+    df = sample_frame()
+    df.to_csv(tmp_path / "pandas.csv", index=False)
+
+    export_to_file(df, tmp_path / "export.csv", format="csv")
+
+    assert (tmp_path / "export.csv").read_bytes() == (tmp_path / "pandas.csv").read_bytes()
+
+
+def test_xlsx_export_matches_pandas(tmp_path):
+    df = sample_frame()
+    df.to_excel(tmp_path / "pandas.xlsx", index=False)
+
+    export_to_file(df, tmp_path / "export.xlsx", format="xlsx")
+
+    pd.testing.assert_frame_equal(
+        pd.read_excel(tmp_path / "export.xlsx"), pd.read_excel(tmp_path / "pandas.xlsx")
+    )
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_trend_list_json_export_matches_stdlib_encoder(tmp_path, monkeypatch, use_orjson):
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(formatters, "orjson", None)
+    trends = sample_trends()
+    expected = json.dumps(formatters.trend_list_to_dicts(trends), ensure_ascii=False, indent=2)
+
+    export_to_file(trends, tmp_path / "export.json", format="json")
+
+    assert (tmp_path / "export.json").read_text(encoding="utf-8") == expected
@@ -0,0 +1,94 @@
+"""Tests for the conditional HTTP request cache."""
+
+import json
+
+import pytest
+import requests
+
+from gtrends_core.utils.http_cache import ConditionalRequestCache
+
+
+def make_response(status_code, text="", headers=None):
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = text.encode("utf-8")
+    response.encoding = "utf-8"
+    response.headers.update(headers or {})
+    return response
+
+
+class FakeSession:
+    """Session returning queued responses and recording request headers."""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.requests = []
+
+    def get(self, url, params=None, headers=None, timeout=None):
+        self.requests.append((url, headers))
+        return self.responses.pop(0)
+
+
+def test_not_modified_response_is_served_from_cache(tmp_path):
+    cache_path = tmp_path / "cache.json"
+    session = FakeSession(
+        make_response(200, "<rss/>", {"ETag": '"v1"', "Last-Modified": "Mon, 01 Jan 2024"}),
+        make_response(304),
+    )
+
+    assert ConditionalRequestCache(cache_path).get(session, "https://example.com/rss") == "<rss/>"
+    # A new instance reads the validators persisted by the first one
+    assert ConditionalRequestCache(cache_path).get(session, "https://example.com/rss") == "<rss/>"
+
+    assert session.requests[0][1] == {}
+    assert session.requests[1][1] == {
+        "If-None-Match": '"v1"',
+        "If-Modified-Since": "Mon, 01 Jan 2024",
+    }
+
+
+def test_responses_without_validators_are_not_cached(tmp_path):
+    cache_path = tmp_path / "cache.json"
+    session = FakeSession(make_response(200, "a"), make_response(200, "b"))
+    cache = ConditionalRequestCache(cache_path)
+
+    assert cache.get(session, "https://example.com/rss") == "a"
+    assert cache.get(session, "https://example.com/rss") == "b"
+    assert session.requests[1][1] == {}
+    assert not cache_path.exists()
+
+
+def test_error_responses_raise(tmp_path):
+    session = FakeSession(make_response(500))
+
+    with pytest.raises(requests.HTTPError):
+        ConditionalRequestCache(tmp_path / "cache.json").get(session, "https://example.com/rss")
+
+
+def test_oldest_entries_are_evicted(tmp_path):
+    cache_path = tmp_path / "cache.json"
+    urls = [f"https://example.com/{i}" for i in range(3)]
+    session = FakeSession(*[make_response(200, url, {"ETag": url}) for url in urls])
+    cache = ConditionalRequestCache(cache_path, max_entries=2)
+
+    for url in urls:
+        cache.get(session, url)
+
+    cached_urls = [json.loads(key)[0] for key in json.loads(cache_path.read_text())]
+    assert cached_urls == urls[1:]
+
+
+def test_cache_is_written_atomically_without_leftover_files(tmp_path):
+    cache_dir = tmp_path / "nested" / "dir"
+    session = FakeSession(make_response(200, "body", {"ETag": '"v1"'}))
+
+    ConditionalRequestCache(cache_dir / "cache.json").get(session, "https://example.com/rss")
+
+    assert [path.name for path in cache_dir.iterdir()] == ["cache.json"]
+
+
+def test_default_path_is_resolved_when_used(tmp_path, monkeypatch):
+    cache = ConditionalRequestCache()
+    monkeypatch.setenv("HOME", str(tmp_path))
+
+    assert cache.cache_path == tmp_path / ".cache" / "gtrends" / "http_etag.json"
@@ -0,0 +1,45 @@
+"""Tests for the token-bucket rate limiter."""
+
+import pytest
+
+from gtrends_core.utils import ratelimit
+from gtrends_core.utils.ratelimit import TokenBucket
+
+
+@pytest.fixture
+def clock(fake_clock, monkeypatch):
+    monkeypatch.setattr(ratelimit, "time", fake_clock)
+    return fake_clock
+
+
+def test_full_bucket_serves_a_burst_up_to_capacity(clock):
+    bucket = TokenBucket(rate=1.0, capacity=3)
+
+    assert [bucket.acquire(block=False) for _ in range(4)] == [True, True, True, False]
+    assert clock.sleeps == []
+
+
+def test_tokens_refill_at_the_configured_rate(clock):
+    bucket = TokenBucket(rate=2.0, capacity=1)
+    assert bucket.acquire(block=False)
+
+    clock.now += 0.25
+    assert not bucket.acquire(block=False)
+    clock.now += 0.25
+    assert bucket.acquire(block=False)
+
+
+def test_refill_does_not_exceed_capacity(clock):
+    bucket = TokenBucket(rate=1.0, capacity=2)
+
+    clock.now += 60
+    assert [bucket.acquire(block=False) for _ in range(3)] == [True, True, False]
+
+
+def test_blocking_acquire_waits_for_the_next_token(clock):
+    bucket = TokenBucket(rate=1.0, capacity=1)
+    assert bucket.acquire()
+
+    clock.now += 0.4
+    assert bucket.acquire()
+    assert clock.sleeps == [pytest.approx(0.6)]
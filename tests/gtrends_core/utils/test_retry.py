@@ -0,0 +1,86 @@
+"""Tests for the HTTP 429 retry decorator."""
+
+import pytest
+import requests
+
+from gtrends_core.exceptions.trends_exceptions import RateLimitException
+from gtrends_core.utils import retry
+from gtrends_core.utils.retry import retry_on_429
+
+
+@pytest.fixture
+def clock(fake_clock, monkeypatch):
+    monkeypatch.setattr(retry, "time", fake_clock)
+    monkeypatch.setattr(retry.random, "uniform", lambda a, b: 0.0)
+    return fake_clock
+
+
+def http_error(status_code, retry_after=None):
+    response = requests.Response()
+    response.status_code = status_code
+    if retry_after is not None:
+        response.headers["Retry-After"] = retry_after
+    return requests.HTTPError(f"HTTP {status_code}", response=response)
+
+
+def failing(*errors, result="ok"):
+    """Build a function raising the given errors in turn, then returning result."""
+    calls = []
+    pending = list(errors)
+
+    def func():
+        calls.append(len(calls))
+        if pending:
+            raise pending.pop(0)
+        return result
+
+    return func, calls
+
+
+def test_retries_with_exponential_backoff_until_success(clock):
+    func, calls = failing(http_error(429), http_error(429))
+
+    assert retry_on_429(max_attempts=4, base=0.5, cap=8.0)(func)() == "ok"
+    assert len(calls) == 3
+    assert clock.sleeps == [1.0, 2.0]
+
+
+def test_retry_after_header_is_clamped_to_cap(clock):
+    func, calls = failing(http_error(429, retry_after="30"))
+
+    assert retry_on_429(cap=8.0)(func)() == "ok"
+    assert clock.sleeps == [8.0]
+
+
+def test_time_spent_in_failed_attempt_counts_toward_delay(clock):
+    errors = [http_error(429, retry_after="5")]
+
+    def func():
+        if errors:
+            clock.now += 2.0  # e.g. TrendsPy pausing before it raises
+            raise errors.pop()
+        return "ok"
+
+    assert retry_on_429()(func)() == "ok"
+    assert clock.sleeps == [3.0]
+
+
+def test_raises_rate_limit_exception_after_max_attempts(clock):
+    func, calls = failing(*[http_error(429, retry_after="3") for _ in range(3)])
+
+    with pytest.raises(RateLimitException) as exc_info:
+        retry_on_429(max_attempts=3)(func)()
+
+    assert len(calls) == 3
+    assert exc_info.value.context["retry_after"] == 3
+    assert isinstance(exc_info.value.__cause__, requests.HTTPError)
+
+
+def test_other_http_errors_are_not_retried(clock):
+    func, calls = failing(http_error(500))
+
+    with pytest.raises(requests.HTTPError):
+        retry_on_429()(func)()
+
+    assert len(calls) == 1
+    assert clock.sleeps == []
@@ -0,0 +1,13 @@
+"""Tests for the parameter validators."""
+
+from gtrends_core.utils.validators import validate_export_path
+
+
+def test_validate_export_path_recreates_a_removed_directory(tmp_path):
+    export_dir = tmp_path / "exports"
+
+    assert validate_export_path(str(export_dir)) == export_dir
+    export_dir.rmdir()
+
+    validate_export_path(str(export_dir))
+    assert export_dir.is_dir()